@@ -19,10 +19,6 @@ a = Analysis(
     binaries=[],
     datas=datas,
     hiddenimports=[
-        'colormath',
-        'colormath.color_objects',
-        'colormath.color_conversions',
-        'networkx',
         'secrets',
     ],
     hookspath=[],
@@ -30,7 +26,8 @@ a = Analysis(
     runtime_hooks=[],
     excludes=['tkinter', 'unittest', 'test'],
     noarchive=False,
-    optimize=0,
+    # Ship -OO bytecode (asserts and docstrings stripped) in the PYZ archive
+    optimize=2,
 )
 pyz = PYZ(a.pure)
 
@@ -17,7 +17,7 @@ def main():
     """Generate the Pantone data files."""
     print("Starting Pantone data generation...")
     try:
-        result = PantoneData.generate_xyz_json()
+        result = PantoneData.generate_xyz_json(force="--force" in sys.argv)
         print(result)
         print("Pantone data generation completed successfully.")
     except Exception as e:
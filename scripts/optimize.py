@@ -8,43 +8,158 @@ of all modules for faster loading.
 import os
 import sys
 import py_compile
-import compileall
-import shutil
 import zipfile
 import argparse
+import importlib.util
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+from py_compile import PycInvalidationMode
 from pathlib import Path
 
-def compile_python_files(directory, force=False):
+# Number of source files handed to each worker process at a time
+COMPILE_CHUNK_SIZE = 64
+# Entry point written at the root of the archive so it runs with `python tiinyswatch_compiled.zip`
+ZIP_MAIN_SOURCE = "from tiinyswatch.__main__ import main\n\nmain()\n"
+# --invalidation-mode choices. Hash-based pycs stay valid when packaging shifts
+# mtimes; unchecked ones also skip the source hash on import (immutable installs).
+INVALIDATION_MODES = {
+    'timestamp': PycInvalidationMode.TIMESTAMP,
+    'checked-hash': PycInvalidationMode.CHECKED_HASH,
+    'unchecked-hash': PycInvalidationMode.UNCHECKED_HASH,
+}
+# PEP 552 flags word (pyc header bytes 4-8) written for each invalidation mode
+PYC_FLAGS = {
+    PycInvalidationMode.TIMESTAMP: 0b00,
+    PycInvalidationMode.CHECKED_HASH: 0b11,
+    PycInvalidationMode.UNCHECKED_HASH: 0b01,
+}
+
+def _pyc_flags(cfile):
+    """Return the flags word from a pyc header, or None if it can't be read."""
+    try:
+        with open(cfile, 'rb') as f:
+            header = f.read(8)
+    except OSError:
+        return None
+    if len(header) < 8:
+        return None
+    return int.from_bytes(header[4:8], 'little')
+
+def collect_python_files(directory, force=False, invalidation_mode=PycInvalidationMode.UNCHECKED_HASH):
+    """
+    Walk directory once and return the .py files that need compiling.
+    Symlinked duplicates are dropped by realpath, and unless force is set
+    files whose cached bytecode is newer than the source and was written
+    with the requested invalidation mode are skipped.
+    """
+    seen = set()
+    paths = []
+    for root, dirs, files in os.walk(directory):
+        dirs[:] = [d for d in dirs if d != '__pycache__']
+        for file in files:
+            if not file.endswith('.py'):
+                continue
+            path = os.path.realpath(os.path.join(root, file))
+            if path in seen:
+                continue
+            seen.add(path)
+            if not force:
+                cfile = importlib.util.cache_from_source(path, optimization=2)
+                try:
+                    if (os.stat(cfile).st_mtime >= os.stat(path).st_mtime
+                            and _pyc_flags(cfile) == PYC_FLAGS[invalidation_mode]):
+                        continue
+                except OSError:
+                    pass
+            paths.append(path)
+    return paths
+
+def _compile_chunk(paths, invalidation_mode=PycInvalidationMode.UNCHECKED_HASH):
+    """Worker: compile a chunk of files, returning (path, error) for each failure."""
+    failures = []
+    for path in paths:
+        try:
+            py_compile.compile(
+                path,
+                doraise=True,
+                optimize=2,  # 0=no optimization, 1=remove asserts, 2=full optimization
+                invalidation_mode=invalidation_mode
+            )
+        except py_compile.PyCompileError as e:
+            failures.append((path, e.msg))
+    return failures
+
+def set_pycache_prefix(prefix):
+    """
+    Write bytecode under prefix instead of __pycache__ next to the sources.
+    The environment variable carries it to spawned worker processes as well.
+    """
+    prefix = os.path.abspath(prefix)
+    sys.pycache_prefix = prefix
+    os.environ['PYTHONPYCACHEPREFIX'] = prefix
+
+def compile_python_files(directory, force=False, invalidation_mode=PycInvalidationMode.UNCHECKED_HASH):
     """Compile all Python files in directory to bytecode."""
     print(f"Compiling Python files in {directory}...")
-    success = compileall.compile_dir(
-        directory, 
-        force=force,
-        quiet=0,  # 0=normal output, 1=quiet, 2=extra quiet
-        legacy=False,  # Use PEP 3147 location for compiled files
-        optimize=2,  # 0=no optimization, 1=remove asserts, 2=full optimization
-        workers=0  # 0=auto-detect number of workers
-    )
-    return success
+    paths = collect_python_files(directory, force=force, invalidation_mode=invalidation_mode)
+    if not paths:
+        print("Bytecode is up to date.")
+        return True
+
+    chunks = [paths[i:i + COMPILE_CHUNK_SIZE] for i in range(0, len(paths), COMPILE_CHUNK_SIZE)]
+    failures = []
+    if len(chunks) == 1:
+        # Not worth starting a process pool for a single chunk
+        failures.extend(_compile_chunk(chunks[0], invalidation_mode))
+    else:
+        with ProcessPoolExecutor() as executor:
+            for result in executor.map(_compile_chunk, chunks, itertools.repeat(invalidation_mode)):
+                failures.extend(result)
+
+    for path, msg in failures:
+        print(msg)
+    print(f"Compiled {len(paths) - len(failures)} of {len(paths)} files.")
+    return not failures
+
+def _walk_archive_files(root, prefix=''):
+    """
+    Yield (path, arcname) for the .py/.pyc/.pyo files under root in sorted order,
+    preceded by a 'dir/' entry for each directory: zipimport only resolves
+    namespace packages (no __init__.py) through such directory entries.
+    os.scandir hands back the file type with the listing, and arcnames are built
+    up per directory instead of with relpath for every file.
+    """
+    with os.scandir(root) as it:
+        entries = sorted(it, key=lambda e: e.name)
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            # __pycache__ contents are picked up per module by create_zip_archive
+            if entry.name == '__pycache__':
+                continue
+            yield entry.path, prefix + entry.name + '/'
+            yield from _walk_archive_files(entry.path, prefix + entry.name + '/')
+        elif entry.name.endswith(('.py', '.pyc', '.pyo')):
+            yield entry.path, prefix + entry.name
 
 def create_zip_archive(source_dir, zip_path):
-    """Create a zip archive of the compiled files."""
+    """
+    Create a zip archive of the compiled files.
+    Entries are stored uncompressed so zipimport reads them without an inflate
+    pass, and each module is shipped once: as its optimized bytecode under the
+    name zipimport looks for (module.pyc) when compiled, otherwise as source.
+    """
     print(f"Creating zip archive at {zip_path}...")
     
-    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        for root, dirs, files in os.walk(source_dir):
-            # Skip __pycache__ directories since we want the compiled files
-            # that are in the original directories
-            if '__pycache__' in root:
-                continue
-                
-            for file in files:
-                file_path = os.path.join(root, file)
-                # Only include .py, .pyc, and .pyo files
-                if file.endswith(('.py', '.pyc', '.pyo')):
-                    # Get the relative path from source_dir
-                    rel_path = os.path.relpath(file_path, source_dir)
-                    zipf.write(file_path, rel_path)
+    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_STORED) as zipf:
+        for file_path, rel_path in _walk_archive_files(source_dir):
+            if rel_path.endswith('.py'):
+                cfile = importlib.util.cache_from_source(file_path, optimization=2)
+                if os.path.exists(cfile):
+                    zipf.write(cfile, rel_path + 'c')
+                    continue
+            zipf.write(file_path, rel_path)
+
+        zipf.writestr('__main__.py', ZIP_MAIN_SOURCE)
     
     print(f"Zip archive created at {zip_path}")
     return True
@@ -54,14 +169,22 @@ def main():
     parser = argparse.ArgumentParser(description="Optimize Python modules for faster loading")
     parser.add_argument('--force', action='store_true', help='Force recompilation even if timestamps suggest it is not needed')
     parser.add_argument('--zip', action='store_true', help='Create a zip archive of compiled modules')
+    parser.add_argument('--invalidation-mode', choices=INVALIDATION_MODES, default='unchecked-hash',
+                        help='How the compiled bytecode is checked against its source on import')
+    parser.add_argument('--pycache-prefix', default=os.environ.get('PYTHONPYCACHEPREFIX'),
+                        help='Directory tree to write bytecode to (defaults to $PYTHONPYCACHEPREFIX)')
     args = parser.parse_args()
+
+    if args.pycache_prefix:
+        set_pycache_prefix(args.pycache_prefix)
     
     # Determine the source directory
     current_dir = Path(__file__).parent
     src_dir = (current_dir / '..' / 'src').resolve()
     
     # Compile Python files
-    success = compile_python_files(src_dir, force=args.force)
+    success = compile_python_files(src_dir, force=args.force,
+                                   invalidation_mode=INVALIDATION_MODES[args.invalidation_mode])
     
     if not success:
         print("Compilation failed. See error messages above.")
@@ -19,11 +19,6 @@ def main():
     """Test loading the pantone data."""
     print("Testing Pantone data loading...")
     
-    # Test loading each format
-    start_time = time.time()
-    PantoneData.initialize()
-    print(f"Initialization time: {time.time() - start_time:.4f} seconds")
-    
     # Load the data
     start_time = time.time()
     PantoneData._ensure_loaded()
@@ -33,7 +28,7 @@ def main():
     names = PantoneData.get_names()
     xyz_values = PantoneData.get_xyz_values()
     
-    if names and xyz_values:
+    if names and len(xyz_values):
         print(f"Successfully loaded {len(names)} Pantone colors")
         print(f"First few names: {names[:5]}")
         print(f"First few XYZ values: {xyz_values[:2]}")
@@ -4,19 +4,32 @@ Launcher script for TiinySwatch.
 This is a convenience script that imports the main function from the package.
 """
 
+import os
 import sys
-from tiinyswatch.single_application import QtSingleApplication
-from tiinyswatch.app import App
-
-def main():
-    """Start the TiinySwatch application."""
-    appGuid = '414cbe95-2823-478a-8cdd-d5965d913257'
-    app = QtSingleApplication(appGuid, sys.argv)
-    if app.isRunning(): 
-        sys.exit(0)
-    app.setQuitOnLastWindowClosed(False)
-    ex = App()
-    sys.exit(app.exec())
+
+SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+COMPILED_ZIP = os.path.normpath(os.path.join(SRC_DIR, '..', 'tiinyswatch_compiled.zip'))
+
+
+def compiled_zip_is_current():
+    """True if the archive built by `scripts/optimize.py --zip` exists and no source is newer."""
+    try:
+        built = os.stat(COMPILED_ZIP).st_mtime
+    except OSError:
+        return False
+    for root, dirs, files in os.walk(os.path.join(SRC_DIR, 'tiinyswatch')):
+        dirs[:] = [d for d in dirs if d != '__pycache__']
+        for file in files:
+            if file.endswith('.py') and os.stat(os.path.join(root, file)).st_mtime > built:
+                return False
+    return True
+
+
+# Import from the stored bytecode archive, unless the sources were edited after it was built
+if compiled_zip_is_current():
+    sys.path.insert(0, COMPILED_ZIP)
+
+from tiinyswatch.__main__ import main
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
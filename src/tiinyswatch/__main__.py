@@ -3,14 +3,56 @@ Main entry point for the TiinySwatch application.
 """
 
 import sys
-from PySide6.QtWidgets import QApplication
-from tiinyswatch.app import App
+
+APP_GUID = '414cbe95-2823-478a-8cdd-d5965d913257'
+ERROR_ALREADY_EXISTS = 183
+
+# OS handle marking this process as the running instance; released by the OS on exit
+_instance_lock = None
+
+
+def _acquire_instance_lock(app_guid):
+    """
+    Claim the single-instance lock without touching Qt.
+    Returns False if another instance already holds it. Where no cheap primitive is
+    available it returns True and QtSingleApplication's check decides instead.
+    """
+    global _instance_lock
+    if sys.platform == 'win32':
+        import ctypes
+        kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+        handle = kernel32.CreateMutexW(None, False, f'Local\\{app_guid}')
+        if handle and ctypes.get_last_error() == ERROR_ALREADY_EXISTS:
+            kernel32.CloseHandle(handle)
+            return False
+        _instance_lock = handle
+    elif sys.platform.startswith('linux'):
+        import os
+        import socket
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            # Abstract-namespace name: no file to clean up if the process dies
+            sock.bind(f'\0{app_guid}-{os.getuid()}')
+        except OSError:
+            sock.close()
+            return False
+        _instance_lock = sock
+    return True
 
 
 def main():
     """Start the TiinySwatch application."""
-    app = QApplication(sys.argv)
+    # A second instance exits here, before paying for the Qt import and QApplication setup
+    if not _acquire_instance_lock(APP_GUID):
+        sys.exit(0)
+    # Qt is imported on first use so importing this module (or the src/app.py launcher) stays cheap
+    from tiinyswatch.single_application import QtSingleApplication
+    app = QtSingleApplication(APP_GUID, sys.argv)
+    if app.isRunning():
+        sys.exit(0)
     app.setQuitOnLastWindowClosed(False)
+    # Imported here so a second instance exits before loading the UI, color and Pantone modules
+    from tiinyswatch.app import App
     ex = App()
     sys.exit(app.exec())
 
@@ -2,25 +2,36 @@
 Main application class for TiinySwatch.
 """
 
-from PySide6.QtCore import Signal, Qt, QTimer
-from PySide6.QtWidgets import QMainWindow, QSystemTrayIcon
-from PySide6.QtGui import (QIcon, QPixmap, QPainter, QCursor, QGuiApplication, QBrush)
-from typing import Optional
+from functools import lru_cache
+
+from PySide6.QtCore import Signal, Qt, QTimer, QThreadPool
+from PySide6.QtWidgets import QWidget, QSystemTrayIcon
+from PySide6.QtGui import (QIcon, QPixmap, QPainter, QCursor, QGuiApplication, QBrush, QColor)
 
 from tiinyswatch.utils.settings import Settings
 from tiinyswatch.utils.keybind_manager import KeybindManager
 from tiinyswatch.utils.pantone_data import PantoneData
-from tiinyswatch.utils.notification_manager import NotificationManager
-from tiinyswatch.ui.dialogs.transparent_overlay import TransparentOverlay
-from tiinyswatch.ui.widgets.color_picker import ColorPicker
 from tiinyswatch.ui.menus.settings_menu import SettingsMenu
 from tiinyswatch.ui.styles import get_dark_style
 
 
-class App(QMainWindow):
+@lru_cache(maxsize=256)
+def _colored_icon(rgb: int, size: int) -> QIcon:
+    """Build (once per unique color) a solid square icon for the given 0xAARRGGBB value."""
+    pixmap = QPixmap(size, size)
+    pixmap.fill(Qt.transparent)  # Initialize with transparency
+    painter = QPainter(pixmap)
+    painter.fillRect(0, 0, size, size, QBrush(QColor.fromRgba(rgb)))
+    painter.end()
+    return QIcon(pixmap)
+
+
+class App(QWidget):
     """
     Main application class for TiinySwatch color picker and manager.
     Manages system tray integration, hotkeys, and the main UI components.
+    Never shown itself; it is a plain QWidget (rather than a QMainWindow) so it can
+    parent the picker, overlay, dialogs and hotkey window and carry their stylesheet.
     """
     # Constants
     ICON_SIZE: int = 16
@@ -36,16 +47,20 @@ class App(QMainWindow):
         super().__init__()
         Settings.load()
         
-        # Initialize managers with lazy loading where possible
+        # Initialize managers with lazy loading where possible. PantoneData and
+        # NotificationManager need no setup here: Pantone data loads on first use
+        # (or from the background preload below) and notifications are class-level.
         self.keybindManager = KeybindManager.initialize(self)
-        PantoneData.initialize()  # Already optimized for lazy loading
-        NotificationManager.initialize()
 
         # Setup component references without instantiating them yet
         self.colorPicker = None
         self.overlay = None
         self.pickerToggled = False
         self.overlayToggled = False
+        self.trayIconRgba = None  # Color currently shown by the tray icon
+        # Snapshot of the current colors/selection, kept up to date by the Settings listeners
+        self.currentColors = Settings.get("currentColors")
+        self.selectedIndex = Settings.get("selectedIndex")
         
         self.setStyleSheet(get_dark_style())
 
@@ -55,6 +70,9 @@ class App(QMainWindow):
         
         # 2. Then connect signals needed for core functionality
         self.setupSignals()
+
+        # Warm the Pantone data off the UI thread now that the tray icon is up
+        QThreadPool.globalInstance().start(PantoneData.preload)
         
         # 3. Finally setup hotkeys which might take a bit more time
         # Do this in the next event loop iteration to let the UI appear first
@@ -67,7 +85,7 @@ class App(QMainWindow):
         
         # Setup system tray - this is essential
         self.trayIcon = QSystemTrayIcon(self)
-        self.trayIcon.setIcon(self.createColoredIcon(Settings.getCurrentColor()))
+        self.setTrayIconColor(Settings.getCurrentColor())
         self.trayIcon.activated.connect(self.onTrayActivation)
         
         # Create the tray menu but delay building complex menu items
@@ -79,14 +97,14 @@ class App(QMainWindow):
         self.toggleOverlaySignal.connect(self.toggleColorPick)
         self.toggleColorPickerSignal.connect(self.toggleColorPicker)
         self.toggleHistoryWidgetSignal.connect(self.toggleHistoryWidget)
-        Settings.addListener("SET", "currentColors", self.updateColorInfo)
-        Settings.addListener("SET", "selectedIndex", self.updateColorInfo)
+        Settings.addListener("SET", "currentColors", self.onCurrentColorsSet)
+        Settings.addListener("SET", "selectedIndex", self.onSelectedIndexSet)
 
     def setupHotkeys(self) -> None:
         """Setup keyboard shortcuts."""
-        self.keybindManager.bindKey("PICK_KEYBIND", lambda: self.toggleOverlaySignal.emit())
-        self.keybindManager.bindKey("TOGGLE_KEYBIND", lambda: self.toggleColorPickerSignal.emit())
-        self.keybindManager.bindKey("HISTORY_KEYBIND", lambda: self.toggleHistoryWidgetSignal.emit())
+        self.keybindManager.bindKey("PICK_KEYBIND", self.toggleOverlaySignal.emit)
+        self.keybindManager.bindKey("TOGGLE_KEYBIND", self.toggleColorPickerSignal.emit)
+        self.keybindManager.bindKey("HISTORY_KEYBIND", self.toggleHistoryWidgetSignal.emit)
 
     def setupTrayMenu(self) -> None:
         """Set up the system tray menu."""
@@ -97,6 +115,8 @@ class App(QMainWindow):
         """Toggle the color picker visibility."""
         if not self.pickerToggled:
             if not self.colorPicker:
+                # The picker's widget tree is only loaded the first time it's opened
+                from tiinyswatch.ui.widgets.color_picker import ColorPicker
                 self.colorPicker = ColorPicker(self)
                 mousePos = QCursor.pos()
                 self.colorPicker.move(
@@ -115,19 +135,39 @@ class App(QMainWindow):
         if self.colorPicker:
             self.colorPicker.toggleHistory()
 
-    def updateColorInfo(self, _color) -> None:
+    def onCurrentColorsSet(self, colors) -> None:
+        """Track the new current colors and refresh the tray icon."""
+        self.currentColors = colors
+        self.updateColorInfo()
+
+    def onSelectedIndexSet(self, index) -> None:
+        """Track the new selected index and refresh the tray icon."""
+        self.selectedIndex = index
+        self.updateColorInfo()
+
+    def updateColorInfo(self) -> None:
         """Update tray icon with the current color."""
-        colors = Settings.get("currentColors")
-        index = Settings.get("selectedIndex")
-        if index < len(colors):
-            self.trayIcon.setIcon(self.createColoredIcon(colors[index]))
+        if self.selectedIndex < len(self.currentColors):
+            self.setTrayIconColor(self.currentColors[self.selectedIndex])
+
+    def setTrayIconColor(self, color) -> None:
+        """Show the color in the tray icon, skipping the update if it's unchanged."""
+        rgba = color.qcolor.rgba()
+        if rgba == self.trayIconRgba:
+            return
+        self.trayIconRgba = rgba
+        self.trayIcon.setIcon(self.createColoredIcon(color))
 
     def toggleColorPick(self) -> None:
         """Start the color picking process."""
         screen = QGuiApplication.screenAt(QCursor.pos()) or QGuiApplication.primaryScreen()
         screenshot = screen.grabWindow(0)
+        # Keep the capture at native resolution; tagging it with the screen's
+        # ratio lets the overlay blit it 1:1 instead of resampling on paint.
+        screenshot.setDevicePixelRatio(screen.devicePixelRatio())
         
         if not self.overlay:
+            from tiinyswatch.ui.dialogs.transparent_overlay import TransparentOverlay
             self.overlay = TransparentOverlay(self, screenshot, target_screen=screen)
             self.overlay.show()
             self.overlayToggled = True
@@ -142,13 +182,8 @@ class App(QMainWindow):
             self.toggleColorPicker()
 
     def createColoredIcon(self, color) -> QIcon:
-        """Create a colored icon for the system tray."""
-        pixmap = QPixmap(self.ICON_SIZE, self.ICON_SIZE)
-        pixmap.fill(Qt.transparent)  # Initialize with transparency
-        painter = QPainter(pixmap)
-        painter.fillRect(0, 0, self.ICON_SIZE, self.ICON_SIZE, QBrush(color.qcolor))
-        painter.end()
-        return QIcon(pixmap)
+        """Create a colored icon for the system tray, reusing icons for repeat colors."""
+        return _colored_icon(color.qcolor.rgba(), self.ICON_SIZE)
 
     def closeApp(self) -> None:
         """Clean up and close the application."""
@@ -1,4 +1,5 @@
 from PySide6.QtGui import QColor
+from functools import lru_cache
 import numpy as np
 import json
 from . import conversions
@@ -162,25 +163,63 @@ COLOR_SPACES = {
     }
 }
 
+# Row layout of the per-instance component table; bit i of a dirty mask is row i
+_SPACE_INDEX = {space: i for i, space in enumerate(COLOR_SPACES)}
+_SPACE_SIZE = {space: len(spec['keys']) for space, spec in COLOR_SPACES.items()}
+# space -> {component key: column}
+_KEY_INDEX = {space: {key: i for i, key in enumerate(spec['keys'])} for space, spec in COLOR_SPACES.items()}
+_MAX_COMPONENTS = max(_SPACE_SIZE.values())
+_SPACE_BIT = {space: 1 << i for space, i in _SPACE_INDEX.items()}
+_XYZ_BIT = _SPACE_BIT['xyz']
+# Spaces that get invalidated when another space becomes the source
+_DIRTIABLE_MASK = sum(_SPACE_BIT[space] for space, spec in COLOR_SPACES.items() if spec.get('has_dirty', True))
+# space -> dirty mask right after that space becomes the source: every other
+# dirtiable space is stale, and so is xyz unless it is the source itself
+_SOURCE_DIRTY_MASK = {space: (_DIRTIABLE_MASK & ~bit) | (0 if bit == _XYZ_BIT else _XYZ_BIT)
+                      for space, bit in _SPACE_BIT.items()}
+# Spaces whose conversions take (observer, illuminant) positionally after the components
+_PARAMETRIC_SPACES = frozenset(space for space, spec in COLOR_SPACES.items() if 'default_observer' in spec)
+# space -> (default observer, default illuminant)
+_DEFAULT_PARAMS = {space: (spec.get('default_observer'), spec.get('default_illuminant'))
+                   for space, spec in COLOR_SPACES.items()}
+# Per-space clamp bounds taken from COLOR_SPACES ranges
+_RANGE_MINS = {space: np.array([r[0] for r in spec['ranges']], dtype=float) for space, spec in COLOR_SPACES.items()}
+_RANGE_MAXS = {space: np.array([r[1] for r in spec['ranges']], dtype=float) for space, spec in COLOR_SPACES.items()}
+
+# (space, direction, observer, illuminant) -> conversion with its parameters bound
+_BOUND_CONVERSIONS = {}
+
+def _bound_conversion(space, direction, observer, illuminant):
+    """Return COLOR_SPACES[space][direction] with observer/illuminant bound, built once per combination."""
+    key = (space, direction, observer, illuminant)
+    func = _BOUND_CONVERSIONS.get(key)
+    if func is None:
+        convert = COLOR_SPACES[space][direction]
+        if space in _PARAMETRIC_SPACES:
+            def func(components):
+                return convert(components, observer, illuminant)
+        else:
+            func = convert
+        _BOUND_CONVERSIONS[key] = func
+    return func
+
 class QColorEnhanced:
     """Maintains a color's state in various color spaces with lazy conversions."""
 
+    # Palettes and history hold many colors, so instances skip the per-object __dict__
+    __slots__ = ('_components', '_dirty', '_params', '_alpha', '_current_source')
+
     _pantone_iab_values = None
+    _pantone_iab_sqnorms = None  # Squared row norms of the Pantone IAB table
     BLACK_IAB = np.array([0, 0, 0])
     WHITE_IAB = np.array([1, 0, 0])
 
     def __init__(self, **kwargs):
-        self._color_spaces = {}
-        for space, spec in COLOR_SPACES.items():
-            num_components = len(spec['keys'])
-            self._color_spaces[space] = {
-                'components': np.zeros(num_components, dtype=float),
-                'dirty': spec.get('has_dirty', True),
-            }
-            if 'default_observer' in spec:
-                self._color_spaces[space]['observer'] = spec['default_observer']
-            if 'default_illuminant' in spec:
-                self._color_spaces[space]['illuminant'] = spec['default_illuminant']
+        # One row per color space (padded to the widest space) and a dirty bitmask
+        self._components = np.zeros((len(COLOR_SPACES), _MAX_COMPONENTS), dtype=float)
+        self._dirty = _DIRTIABLE_MASK
+        # Per-space observer/illuminant overrides of the COLOR_SPACES defaults
+        self._params = {}
 
         color_spaces_in_kwargs = [key for key in kwargs if key in COLOR_SPACES]
         if len(color_spaces_in_kwargs) > 1:
@@ -207,44 +246,41 @@ class QColorEnhanced:
             alpha=qcolor.alphaF()
         )
 
+    def _row(self, space):
+        """View of the space's components in the component table."""
+        return self._components[_SPACE_INDEX[space], :_SPACE_SIZE[space]]
+
+    def _space_params(self, space):
+        defaults = _DEFAULT_PARAMS[space]
+        overrides = self._params.get(space)
+        if not overrides:
+            return defaults
+        return (overrides.get('observer', defaults[0]),
+                overrides.get('illuminant', defaults[1]))
+
     def _update_array_from_dict(self, space, updates: dict):
-        for i, key in enumerate(COLOR_SPACES[space]['keys']):
-            if key in updates:
-                self._color_spaces[space]['components'][i] = updates[key]
-
-    def _mark_others_dirty(self, except_space=None):
-        except_space = except_space or []
-        for space, data in self._color_spaces.items():
-            if space in except_space:
-                continue
-            if COLOR_SPACES[space].get('has_dirty', True):
-                data['dirty'] = True
+        row = self._row(space)
+        key_index = _KEY_INDEX[space]
+        for key, value in updates.items():
+            i = key_index.get(key)
+            if i is not None:
+                row[i] = value
 
     def _ensure_xyz_is_current(self):
-        if not self._color_spaces['xyz']['dirty']:
+        if not self._dirty & _XYZ_BIT:
             return
 
         if self._current_source == 'xyz':
-            self._color_spaces['xyz']['dirty'] = False
+            self._dirty &= ~_XYZ_BIT
             return
 
         canonical = self._current_source
-        spec = COLOR_SPACES[canonical]
-        comp_array = self._color_spaces[canonical]['components']
-        observer = self._color_spaces[canonical].get('observer', spec.get('default_observer'))
-        illuminant = self._color_spaces[canonical].get('illuminant', spec.get('default_illuminant'))
-
-        args = {}
-        if observer:
-            args['observer'] = observer
-        if illuminant:
-            args['illuminant'] = illuminant
-        #if (self._current_source == 'cam16lcd' or self._current_source == 'iab'):
-            #print(self._current_source)
-            #print(comp_array)
-        xyz_arr = spec['to_xyz'](comp_array, **args)
-        self._color_spaces['xyz']['components'] = xyz_arr
-        self._color_spaces['xyz']['dirty'] = False
+        self._row('xyz')[:] = self._conversion(canonical, 'to_xyz')(self._row(canonical))
+        self._dirty &= ~_XYZ_BIT
+
+    def _conversion(self, space, direction):
+        observer, illuminant = self._space_params(space)
+        return _bound_conversion(space, direction, observer, illuminant)
 
     def _ensure_space_in_sync(self, space):
         if space == self._current_source:
@@ -254,40 +290,22 @@ class QColorEnhanced:
             self._ensure_xyz_is_current()
             return
 
-        if self._color_spaces[space]['dirty']:
+        if self._dirty & _SPACE_BIT[space]:
             self._ensure_xyz_is_current()
-            spec = COLOR_SPACES[space]
-            xyz_arr = self._color_spaces['xyz']['components']
-
-            observer = self._color_spaces[space].get('observer', spec.get('default_observer'))
-            illuminant = self._color_spaces[space].get('illuminant', spec.get('default_illuminant'))
-
-            args = {}
-            if observer:
-                args['observer'] = observer
-            if illuminant:
-                args['illuminant'] = illuminant
-
-            self._color_spaces[space]['components'] = spec['from_xyz'](xyz_arr, **args)
-            self._color_spaces[space]['dirty'] = False
+            self._row(space)[:] = self._conversion(space, 'from_xyz')(self._row('xyz'))
+            self._dirty &= ~_SPACE_BIT[space]
 
     def _update_from_space(self, space, new_values: dict):
         self._update_array_from_dict(space, new_values)
         self._update_space_components(space)
 
     def _update_tuple_from_space(self, space, new_values):
-        self._color_spaces[space]['components'] = np.array(new_values, dtype=float)
+        self._row(space)[:] = np.asarray(new_values, dtype=float)
         self._update_space_components(space)
 
     def _update_space_components(self, space):
-        if space == 'xyz':
-            self._color_spaces['xyz']['dirty'] = False
-            self._current_source = 'xyz'
-        else:
-            self._color_spaces[space]['dirty'] = False
-            self._current_source = space
-            self._color_spaces['xyz']['dirty'] = True
-        self._mark_others_dirty(except_space=[space])
+        self._dirty = _SOURCE_DIRTY_MASK[space]
+        self._current_source = space
 
     def get_alpha(self):
         return self._alpha
@@ -296,35 +314,32 @@ class QColorEnhanced:
         self._alpha = value
 
     def get(self, space, component=None):
-        if space not in self._color_spaces:
+        if space not in COLOR_SPACES:
             return None
         self._ensure_space_in_sync(space)
-        comps = self._color_spaces[space]['components']
-        keys = COLOR_SPACES[space]['keys']
+        comps = self._row(space)
         if component is None:
-            return dict(zip(keys, comps))
-        try:
-            idx = keys.index(component)
-            return comps[idx]
-        except ValueError:
-            return None
+            return dict(zip(COLOR_SPACES[space]['keys'], comps))
+        idx = _KEY_INDEX[space].get(component)
+        return comps[idx] if idx is not None else None
 
     @classmethod
     def _clamp_values(cls, values, space):
-        ranges = COLOR_SPACES[space]['ranges']
-        mins = np.array([r[0] for r in ranges])
-        maxs = np.array([r[1] for r in ranges])
-        return np.clip(values, mins, maxs)
+        return np.clip(values, _RANGE_MINS[space], _RANGE_MAXS[space])
 
     def get_tuple(self, space, clamped=False):
         self._ensure_space_in_sync(space)
-        components = self._color_spaces[space]['components'].copy()
+        components = self._row(space)
         if clamped:
+            # np.clip allocates the result, so the stored row is never exposed
             return self._clamp_values(components, space)
-        return components
+        # Read-only view of the stored row; it is only valid until the color changes
+        view = components.view()
+        view.flags.writeable = False
+        return view
 
     def set_tuple(self, space, new_values):
-        if space not in self._color_spaces:
+        if space not in COLOR_SPACES:
             return
         self._update_tuple_from_space(space, new_values)
 
@@ -335,8 +350,8 @@ class QColorEnhanced:
             if component is None:
                 return ranges
             try:
-                index = COLOR_SPACES[space]['keys'].index(component)
-                return ranges[index]
+                index = _KEY_INDEX[space].get(component)
+                return ranges[index] if index is not None else None
             except (IndexError, TypeError):
                 return None
         return None
@@ -346,9 +361,9 @@ class QColorEnhanced:
         return COLOR_SPACES.get(space, {}).get('keys', [])
 
     def set(self, space, component=None, value=None, **kwargs):
-        if space not in self._color_spaces:
+        if space not in COLOR_SPACES:
             return
-        valid_keys = COLOR_SPACES[space]['keys']
+        valid_keys = _KEY_INDEX[space]
         updates = {}
         if component in valid_keys and value is not None:
             updates[component] = value
@@ -358,41 +373,38 @@ class QColorEnhanced:
 
     @property
     def qcolor(self):
-        srgb = self.get_tuple("srgb", clamped=True)
-        return QColor.fromRgbF(*srgb, 1.0)
+        # tolist() hands Qt plain floats instead of numpy scalars
+        r, g, b = self.get_tuple("srgb", clamped=True).tolist()
+        return QColor.fromRgbF(r, g, b, 1.0)
     
     def name(self):
         return self.qcolor.name()
 
     def is_valid(self):
-        return np.all(np.isfinite(self._color_spaces['xyz']['components']))
+        return np.all(np.isfinite(self._row('xyz')))
+
+    def state_key(self):
+        """
+        Hashable snapshot of the values that define this color (the clean source
+        space, its components and parameters, and alpha), for use as a cache key.
+        """
+        space = self._current_source
+        return (space, tuple(self._row(space).tolist()), *self._space_params(space), self._alpha)
     
     def clone(self):
         new_color = QColorEnhanced()
-        for space, data in self._color_spaces.items():
-            new_color._color_spaces[space]['components'] = data['components'].copy()
-            new_color._color_spaces[space]['dirty'] = data['dirty']
-            for key in ['observer', 'illuminant']:
-                if key in data:
-                    new_color._color_spaces[space][key] = data[key]
-        new_color._alpha = self._alpha
-        new_color._current_source = self._current_source
+        new_color.copy_values(self)
         return new_color
 
     def copy_values(self, other):
-        for space, data in other._color_spaces.items():
-            self._color_spaces[space]['components'] = data['components'].copy()
-            self._color_spaces[space]['dirty'] = data['dirty']
-            for key in ['observer', 'illuminant']:
-                if key in data:
-                    self._color_spaces[space][key] = data[key]
+        self._components = other._components.copy()
+        self._dirty = other._dirty
+        self._params = {space: dict(params) for space, params in other._params.items()}
         self._alpha = other._alpha
         self._current_source = other._current_source
 
     def get_pantone(self):
-        xyz = self.get("xyz")
-        xyz_array = np.array([xyz['x'], xyz['y'], xyz['z']])
-        return self.find_closest_pantone(xyz_array)
+        return self.find_closest_pantone(self.get_tuple("xyz"))
 
     def set_pantone(self, name):
         from tiinyswatch.utils.pantone_data import PantoneData
@@ -409,7 +421,7 @@ class QColorEnhanced:
             xyz_data = PantoneData.get_xyz_values()
             
             # Check if we actually got data and it's in the right format
-            if not xyz_data or len(xyz_data) == 0:
+            if xyz_data is None or len(xyz_data) == 0:
                 print("Warning: No Pantone XYZ data available")
                 # Set empty arrays as fallback
                 cls._pantone_iab_values = np.array([])
@@ -429,23 +441,31 @@ class QColorEnhanced:
                     cls._pantone_iab_values = np.array([])
                     return
             
-            # Convert each XYZ value to IAB
-            cls._pantone_iab_values = np.array([conversions.xyz_to_iab(c) for c in xyz_candidates])
+            # Convert the whole table to IAB in one batched call
+            # float32 halves the table the nearest-match search streams through;
+            # the argmin is insensitive to the lost precision
+            cls._pantone_iab_values = conversions.xyz_to_iab(xyz_candidates).astype(np.float32)
+            cls._pantone_iab_sqnorms = np.einsum('ij,ij->i', cls._pantone_iab_values, cls._pantone_iab_values)
 
     @classmethod
     def find_closest_pantone(cls, target_xyz):
+        # Pickers ask about the same color repeatedly, so lookups are memoized by XYZ
+        return cls._closest_pantone(tuple(np.asarray(target_xyz, dtype=float).tolist()))
+
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _closest_pantone(cls, target_xyz):
         from tiinyswatch.utils.pantone_data import PantoneData
         cls._initialize_pantone_iab()
-        target_iab = conversions.xyz_to_iab(target_xyz)
-        diff = cls._pantone_iab_values - target_iab
-        distances = np.linalg.norm(diff, axis=1)
-        return PantoneData.names[np.argmin(distances)]
+        target_iab = conversions.xyz_to_iab(np.array(target_xyz)).astype(np.float32)
+        # |row - t|^2 = |row|^2 - 2 row.t + |t|^2; the last term doesn't affect the argmin
+        scores = cls._pantone_iab_sqnorms - 2.0 * (cls._pantone_iab_values @ target_iab)
+        return PantoneData.names[int(np.argmin(scores))]
 
     def get_bw_complement(self):
-        iab = self.get_tuple("iab")
-        dist_black = np.sum((iab - self.BLACK_IAB) ** 2)
-        dist_white = np.sum((iab - self.WHITE_IAB) ** 2)
-        return 0 if dist_black < dist_white else 1
+        # BLACK_IAB and WHITE_IAB differ only in I, so the nearer of the two is
+        # decided by which side of their midpoint I falls on
+        return 0 if self.get_tuple("iab")[0] < 0.5 else 1
 
     @classmethod
     def get_white_point(cls, space):
@@ -478,16 +498,16 @@ class QColorEnhanced:
         
         # Save color data for the current source (which is guaranteed to be clean)
         space = self._current_source
-        components = self._color_spaces[space]['components']
+        components = self._row(space)
         keys = COLOR_SPACES[space]['keys']
         
         serialized['space'] = space
         serialized['components'] = dict(zip(keys, components.tolist()))
         
         # Add optional parameters if they exist
-        for key in ['observer', 'illuminant']:
-            if key in self._color_spaces[space]:
-                serialized[key] = self._color_spaces[space][key]
+        for key, value in zip(['observer', 'illuminant'], self._space_params(space)):
+            if value is not None:
+                serialized[key] = value
                 
         return json.dumps(serialized)
     
@@ -538,8 +558,8 @@ class QColorEnhanced:
             
             # Set optional parameters if they exist
             for key in ['observer', 'illuminant']:
-                if key in data and space in color._color_spaces:
-                    color._color_spaces[space][key] = data[key]
+                if key in data:
+                    color._params.setdefault(space, {})[key] = data[key]
                     
             # Ensure current_source is set correctly
             if hasattr(color, '_current_source'):
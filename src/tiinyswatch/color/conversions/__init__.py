@@ -7,8 +7,8 @@ from .hsl_conversions import hsl_to_xyz, xyz_to_hsl
 from .cmyk_conversions import cmyk_to_xyz, xyz_to_cmyk
 from .xyy_conversions import xyy_to_xyz, xyz_to_xyy
 from .ipt_conversions import ipt_to_xyz, xyz_to_ipt
-from .ictcp_conversions import ictcp_to_xyz, xyz_to_ictcp
-from .itp_conversions import itp_to_xyz, xyz_to_itp
+from .ictcp_conversions import ictcp_to_xyz, xyz_to_ictcp, xyz_to_ictcp_batch
+from .itp_conversions import itp_to_xyz, xyz_to_itp, xyz_to_itp_batch
 # Import the Adobe RGB conversions with their actual names
 from .adobe_rgb_conversions import adobe_to_xyz, xyz_to_adobe
 from .oklab_conversions import oklab_to_xyz, xyz_to_oklab
@@ -24,8 +24,8 @@ __all__ = [
     'cmyk_to_xyz', 'xyz_to_cmyk',
     'xyy_to_xyz', 'xyz_to_xyy',
     'ipt_to_xyz', 'xyz_to_ipt',
-    'ictcp_to_xyz', 'xyz_to_ictcp',
-    'itp_to_xyz', 'xyz_to_itp',
+    'ictcp_to_xyz', 'xyz_to_ictcp', 'xyz_to_ictcp_batch',
+    'itp_to_xyz', 'xyz_to_itp', 'xyz_to_itp_batch',
     'iab_to_xyz', 'xyz_to_iab',
     'adobe_to_xyz', 'xyz_to_adobe',
     'oklab_to_xyz', 'xyz_to_oklab',
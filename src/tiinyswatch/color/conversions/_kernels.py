@@ -0,0 +1,9 @@
+"""Small NumPy kernels shared by the perceptual (PQ / power-law) conversions."""
+import numpy as np
+
+
+def signed_power(x, p, out=None):
+    """sign(x) * |x|**p in a single buffer; `out` must not alias x."""
+    result = np.abs(x, out=out)
+    np.power(result, p, out=result)
+    return np.copysign(result, x, out=result)
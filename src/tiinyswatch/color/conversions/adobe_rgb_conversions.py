@@ -1,10 +1,30 @@
-# Imports moved to colormath_wrapper for lazy loading
-from .colormath_wrapper import colormath_wrapper
+import numpy as np
+
+ADOBE_RGB_GAMMA = 2.2
+
+# Linear Adobe RGB (1998) to XYZ (D65) matrix
+ADOBE_RGB_TO_XYZ_D65 = np.array([
+    [0.576700, 0.185556, 0.188212],
+    [0.297361, 0.627355, 0.0752847],
+    [0.0270328, 0.0706879, 0.991248]
+])
+
+# XYZ (D65) to linear Adobe RGB (1998) matrix
+XYZ_TO_ADOBE_RGB_D65 = np.array([
+    [2.04148, -0.564977, -0.344713],
+    [-0.969258, 1.87599, 0.0415557],
+    [0.0134455, -0.118373, 1.01527]
+])
+
+# Contiguous transposed copies for row-vector products
+_ADOBE_RGB_TO_XYZ_T = np.ascontiguousarray(ADOBE_RGB_TO_XYZ_D65.T)
+_XYZ_TO_ADOBE_RGB_T = np.ascontiguousarray(XYZ_TO_ADOBE_RGB_D65.T)
 
-@colormath_wrapper('AdobeRGBColor', 'XYZColor')
 def adobe_to_xyz(comps_array, **kwargs):
-    return 0
+    linear = np.asarray(comps_array, dtype=float) ** ADOBE_RGB_GAMMA
+    return np.maximum(linear @ _ADOBE_RGB_TO_XYZ_T, 0.0)
     
-@colormath_wrapper('XYZColor', 'AdobeRGBColor')
 def xyz_to_adobe(xyz_arr, **kwargs):
-    return 0
\ No newline at end of file
+    # Negative linear values are clipped before gamma encoding
+    linear = np.maximum(np.asarray(xyz_arr, dtype=float) @ _XYZ_TO_ADOBE_RGB_T, 0.0)
+    return linear ** (1 / ADOBE_RGB_GAMMA)
\ No newline at end of file
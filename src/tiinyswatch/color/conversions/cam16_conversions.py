@@ -395,7 +395,7 @@ def _ucs_jab_to_cam_jmh(J_ucs, a_ucs, b_ucs, model):
 
 # --- Public API Functions ---
 
-def xyz_to_cam16ucs(xyz_rel, **kwargs):
+def xyz_to_cam16ucs(xyz_rel, observer="2", illuminant="d65", **kwargs):
     """
     Convert XYZ (relative D65, Y=0..1) to CAM16-UCS (Jab).
     Uses standard 'average' viewing conditions.
@@ -407,7 +407,7 @@ def xyz_to_cam16ucs(xyz_rel, **kwargs):
     ucs_jab = _cam_jmh_to_ucs_jab(J, M, h, 'ucs')
     return ucs_jab
 
-def cam16ucs_to_xyz(ucs_jab, **kwargs):
+def cam16ucs_to_xyz(ucs_jab, observer="2", illuminant="d65", **kwargs):
     """
     Convert CAM16-UCS (Jab) to XYZ (relative D65, Y=0..1).
     Uses standard 'average' viewing conditions.
@@ -418,7 +418,7 @@ def cam16ucs_to_xyz(ucs_jab, **kwargs):
     xyz_abs = _cam16_vars_to_xyz(J, M, h, env)
     return scale1(xyz_abs)
 
-def xyz_to_cam16lcd(xyz_rel, **kwargs):
+def xyz_to_cam16lcd(xyz_rel, observer="2", illuminant="d65", **kwargs):
     """
     Convert XYZ (relative D65, Y=0..1) to CAM16-LCD (Jab).
     Uses standard 'average' viewing conditions.
@@ -430,7 +430,7 @@ def xyz_to_cam16lcd(xyz_rel, **kwargs):
     lcd_jab = _cam_jmh_to_ucs_jab(J, M, h, 'lcd')
     return lcd_jab
 
-def cam16lcd_to_xyz(lcd_jab, **kwargs):
+def cam16lcd_to_xyz(lcd_jab, observer="2", illuminant="d65", **kwargs):
     """
     Convert CAM16-LCD (Jab) to XYZ (relative D65, Y=0..1).
     Uses standard 'average' viewing conditions.
@@ -1,16 +1,21 @@
-# Imports moved to colormath_wrapper for lazy loading
-from .colormath_wrapper import colormath_wrapper
+import numpy as np
+from .srgb_conversions import srgb_to_xyz, xyz_to_srgb
 
-@colormath_wrapper('CMYKColor', 'XYZColor')
 def cmyk_to_xyz(comps_array, **kwargs):
     """
-    Not yet implemented. Instead, uses the colormath library for conversion.
+    Converts CMYK to XYZ through sRGB (via CMY).
     """
-    pass
+    cmyk = np.asarray(comps_array, dtype=float)
+    k = cmyk[..., 3:4]
+    cmy = cmyk[..., :3] * (1.0 - k) + k
+    return srgb_to_xyz(1.0 - cmy)
     
-@colormath_wrapper('XYZColor', 'CMYKColor')
 def xyz_to_cmyk(xyz_color, **kwargs):
     """
-    Not yet implemented. Instead, uses the colormath library for conversion.
+    Converts XYZ to CMYK through sRGB (via CMY).
     """
-    pass
\ No newline at end of file
+    cmy = 1.0 - xyz_to_srgb(xyz_color)
+    k = np.minimum(cmy.min(axis=-1, keepdims=True), 1.0)
+    full = k == 1.0
+    cmy = np.where(full, 0.0, (cmy - k) / np.where(full, 1.0, 1.0 - k))
+    return np.concatenate([cmy, k], axis=-1)
\ No newline at end of file
@@ -1,11 +1,36 @@
-# Imports moved to colormath_wrapper for lazy loading
 import numpy as np
-from .colormath_wrapper import colormath_wrapper
+from .srgb_conversions import srgb_to_xyz, xyz_to_srgb
+from .hsv_conversions import rgb_to_hue
+
+def hsl_to_srgb(hsl):
+    hsl = np.asarray(hsl, dtype=float)
+    h, s, l = hsl[..., 0], hsl[..., 1], hsl[..., 2]
+    q = np.where(l < 0.5, l * (1.0 + s), l + s - (l * s))
+    p = 2.0 * l - q
+    h_k = h / 360.0
+
+    def channel(t):
+        t = np.where(t < 0, t + 1.0, t)
+        t = np.where(t > 1, t - 1.0, t)
+        return np.where(t < 1.0 / 6.0, p + ((q - p) * 6.0 * t),
+               np.where(t < 0.5, q,
+               np.where(t < 2.0 / 3.0, p + ((q - p) * 6.0 * (2.0 / 3.0 - t)), p)))
+
+    return np.stack([channel(h_k + 1.0 / 3.0), channel(h_k), channel(h_k - 1.0 / 3.0)], axis=-1)
+
+def srgb_to_hsl(rgb):
+    rgb = np.asarray(rgb, dtype=float)
+    r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+    rgb_max = rgb.max(axis=-1)
+    rgb_min = rgb.min(axis=-1)
+    delta = rgb_max - rgb_min
+    l = 0.5 * (rgb_max + rgb_min)
+    denom = np.where(l <= 0.5, 2.0 * l, 2.0 - (2.0 * l))
+    s = np.where(delta == 0, 0.0, delta / np.where(delta == 0, 1.0, denom))
+    return np.stack([rgb_to_hue(r, g, b, rgb_max, rgb_min), s, l], axis=-1)
 
-@colormath_wrapper('HSLColor', 'XYZColor')
 def hsl_to_xyz(comps_array, **kwargs):
-    return 0
+    return srgb_to_xyz(hsl_to_srgb(comps_array))
     
-@colormath_wrapper('XYZColor', 'HSLColor')
 def xyz_to_hsl(xyz_color, **kwargs):
-    return 0
\ No newline at end of file
+    return srgb_to_hsl(xyz_to_srgb(xyz_color))
\ No newline at end of file
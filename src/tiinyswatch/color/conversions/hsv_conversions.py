@@ -1,11 +1,40 @@
-# Imports moved to colormath_wrapper for lazy loading
 import numpy as np
-from .colormath_wrapper import colormath_wrapper
+from .srgb_conversions import srgb_to_xyz, xyz_to_srgb
+
+def rgb_to_hue(r, g, b, rgb_max, rgb_min):
+    """Hue in degrees shared by the HSV and HSL models; achromatic colors get 0."""
+    delta = rgb_max - rgb_min
+    safe_delta = np.where(delta == 0, 1.0, delta)
+    hue = np.where(rgb_max == r, (60.0 * (g - b) / safe_delta + 360.0) % 360.0,
+          np.where(rgb_max == g, 60.0 * (b - r) / safe_delta + 120.0,
+                   60.0 * (r - g) / safe_delta + 240.0))
+    return np.where(delta == 0, 0.0, hue)
+
+def hsv_to_srgb(hsv):
+    hsv = np.asarray(hsv, dtype=float)
+    h, s, v = hsv[..., 0], hsv[..., 1], hsv[..., 2]
+    h_floored = np.floor(h)
+    sector = (np.trunc(h_floored / 60.0) % 6).astype(int)
+    f = (h / 60.0) - np.floor_divide(h_floored, 60.0)
+    p = v * (1.0 - s)
+    q = v * (1.0 - f * s)
+    t = v * (1.0 - (1.0 - f) * s)
+    r = np.choose(sector, [v, q, p, p, t, v])
+    g = np.choose(sector, [t, v, v, q, p, p])
+    b = np.choose(sector, [p, p, t, v, v, q])
+    return np.stack([r, g, b], axis=-1)
+
+def srgb_to_hsv(rgb):
+    rgb = np.asarray(rgb, dtype=float)
+    r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+    rgb_max = rgb.max(axis=-1)
+    rgb_min = rgb.min(axis=-1)
+    safe_max = np.where(rgb_max == 0, 1.0, rgb_max)
+    s = np.where(rgb_max == 0, 0.0, 1.0 - (rgb_min / safe_max))
+    return np.stack([rgb_to_hue(r, g, b, rgb_max, rgb_min), s, rgb_max], axis=-1)
 
-@colormath_wrapper('HSVColor', 'XYZColor')
 def hsv_to_xyz(comps_array, **kwargs):
-    return 0
+    return srgb_to_xyz(hsv_to_srgb(comps_array))
     
-@colormath_wrapper('XYZColor', 'HSVColor')
 def xyz_to_hsv(xyz_color, **kwargs):
-    return 0
\ No newline at end of file
+    return srgb_to_hsv(xyz_to_srgb(xyz_color))
\ No newline at end of file
@@ -1,4 +1,5 @@
 import numpy as np
+from ._kernels import signed_power
 
 _M1_IAB = np.array([
     [0.490978, 1.045001, 0.482481, 0],
@@ -17,6 +18,12 @@ _M2_IAB = np.array([
 _M1_IAB_inv = np.linalg.inv(_M1_IAB)
 _M2_IAB_inv = np.linalg.inv(_M2_IAB)
 
+# Contiguous transposed copies for row-vector products
+_M1_IAB_T = np.ascontiguousarray(_M1_IAB.T)
+_M2_IAB_T = np.ascontiguousarray(_M2_IAB.T)
+_M1_IAB_INV_T = np.ascontiguousarray(_M1_IAB_inv.T)
+_M2_IAB_INV_T = np.ascontiguousarray(_M2_IAB_inv.T)
+
 REF_WHITE = np.array([0.9504, 1.0000, 1.0888])
 
 # SA-PQ constants: [c1, c2, c3, m, n]
@@ -29,10 +36,11 @@ def _sa_pq_transfer(y):
     Equation: f_SA-PQ(Y) = ((c1 + c2 * Y^(m)) / (1 + c3 * Y^(m)))^(n)
     """
     c1, c2, c3, m, n = _SA_PQ_CONSTS
-    numerator = c1 + c2 * np.sign(y) * np.power(np.abs(y), m)
-    denominator = 1 + c3 * np.sign(y) * np.power(np.abs(y), m)
+    y_m = signed_power(y, m)
+    numerator = c1 + c2 * y_m
+    denominator = 1 + c3 * y_m
     val = numerator / denominator
-    result = np.sign(val) * np.power(np.abs(val), n)
+    result = signed_power(val, n)
     return result
 
 
@@ -44,51 +52,40 @@ def _sa_pq_transfer_inverse(z):
     """
     c1, c2, c3, m, n = _SA_PQ_CONSTS
     # Remove the exponent n
-    val = np.sign(z) * np.power(np.abs(z), 1.0 / n)
+    val = signed_power(z, 1.0 / n)
     # Solve for y^m
     y_m = (val - c1) / (c2 - c3 * val)
-    result = np.sign(y_m) * np.power(np.abs(y_m), 1.0 / m)
+    result = signed_power(y_m, 1.0 / m)
     return result
 
 
+def _apply_homogeneous(matrix_t, vectors):
+    """
+    Apply a 4x4 projective transform, given transposed, to (..., 3) vectors and
+    divide by the resulting homogeneous coordinate.
+    """
+    vectors = np.asarray(vectors, dtype=float)
+    ones = np.ones(vectors.shape[:-1] + (1,))
+    transformed = np.concatenate([vectors, ones], axis=-1) @ matrix_t
+    return transformed[..., :3] / transformed[..., 3:]
+
+
 def xyz_to_iab(xyz_array, **kwargs):
-    """Convert XYZ to IAB color space."""
-    denormalized_xyz = xyz_array / REF_WHITE 
-    xyz_h = np.append(denormalized_xyz, 1.0).reshape(4, 1)
-    transformed_xyz = _M1_IAB @ xyz_h
-    transformed_xyz /= transformed_xyz[3, 0]
-    lms = transformed_xyz[:3, 0]
+    """Convert XYZ to IAB color space. Accepts a single color or an (N, 3) array."""
+    denormalized_xyz = np.asarray(xyz_array, dtype=float) / REF_WHITE
+    lms = _apply_homogeneous(_M1_IAB_T, denormalized_xyz)
     lms_prime = _sa_pq_transfer(lms)
-    lms_prime_h = np.append(lms_prime, 1.0).reshape(4, 1)
-    
-    transformed_lms = _M2_IAB @ lms_prime_h
-    transformed_lms /= transformed_lms[3, 0]
-    
-    iab = transformed_lms[:3, 0]
-    return iab
+    return _apply_homogeneous(_M2_IAB_T, lms_prime)
 
 
 def iab_to_xyz(iab_array, **kwargs):
-    """Convert IAB to XYZ color space."""
-    # Convert IAPBP coordinates to homogeneous column vector
-    iab_h = np.append(np.array(iab_array), 1.0).reshape(4, 1)
-    
+    """Convert IAB to XYZ color space. Accepts a single color or an (N, 3) array."""
     # Invert the second transformation (M2)
-    lms_prime_h = _M2_IAB_inv @ iab_h
-    lms_prime_h /= lms_prime_h[3, 0]
-    lms_prime = lms_prime_h[:3, 0]
+    lms_prime = _apply_homogeneous(_M2_IAB_INV_T, iab_array)
     
     # Invert the SA-PQ transfer function
     lms = _sa_pq_transfer_inverse(lms_prime)
     
-    # Convert LMS back to homogeneous coordinates
-    lms_h = np.append(lms, 1.0).reshape(4, 1)
-    
-    xyz_h = _M1_IAB_inv @ lms_h
-    xyz_h /= xyz_h[3, 0]
-    
-    xyz_normalized = xyz_h[:3, 0]
-    
-    recovered_xyz = xyz_normalized * REF_WHITE 
+    xyz_normalized = _apply_homogeneous(_M1_IAB_INV_T, lms)
     
-    return recovered_xyz
\ No newline at end of file
+    return xyz_normalized * REF_WHITE
\ No newline at end of file
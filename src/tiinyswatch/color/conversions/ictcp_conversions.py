@@ -1,4 +1,5 @@
 import numpy as np
+from ._kernels import signed_power
 
 # Precompute matrices used in both conversions.
 _M1_ITP = np.array([
@@ -23,6 +24,13 @@ A = np.array([
 ])
 A_inv = np.linalg.inv(A)
 
+# Contiguous transposed copies for row-vector products, with the PQ
+# 10000 cd/m^2 luminance scale folded into the LMS <-> XYZ matrices
+_A_INV_T = np.ascontiguousarray(A_inv.T)
+_A_T = np.ascontiguousarray(A.T)
+_SCALED_LMS_TO_XYZ_T = np.ascontiguousarray(LMS_TO_XYZ.T * 10000.0)
+_XYZ_TO_SCALED_LMS_T = np.ascontiguousarray(XYZ_TO_LMS_MATRIX.T * 1e-4)
+
 # Constants for the non-linear transforms.
 m1 = 0.1593017578125
 m2 = 78.84375
@@ -31,30 +39,40 @@ c2 = 18.8515625
 c3 = 18.6875
 
 def ictcp_to_xyz(itp_array, **kwargs):
-    v = itp_array.copy()
+    v = np.asarray(itp_array, dtype=float)
 
     # Convert ITP to LMS' via matrix multiplication.
-    lms_prime = np.dot(v, A_inv.T)
+    lms_prime = v @ _A_INV_T
+    A_val = signed_power(lms_prime, 1.0 / m2)
 
-    # Apply the non-linear transform elementwise.
-    A_val = np.sign(lms_prime) * np.power(np.abs(lms_prime), 1.0 / m2)
-    Z = (c1 - A_val) / (A_val * c3 - c2)
-    y = np.sign(Z) * np.power(np.abs(Z), 1.0 / m1)
-    lms = y * 10000.0
+    # Z = (c1 - A) / (A * c3 - c2), reusing the A buffer for the denominator
+    Z = c1 - A_val
+    A_val *= c3
+    A_val -= c2
+    Z /= A_val
+    y = signed_power(Z, 1.0 / m1, out=lms_prime)
 
     # Convert LMS to XYZ via matrix multiplication.
-    xyz = np.dot(lms, LMS_TO_XYZ.T)
-    return xyz
+    return y @ _SCALED_LMS_TO_XYZ_T
 
-def xyz_to_ictcp(xyz_array, **kwargs):
+def xyz_to_ictcp_batch(xyz, out=None):
+    """
+    Convert an (N, 3) array of XYZ rows to ICtCp in one pass.
+    Intermediates are updated in place; pass `out` to reuse a result buffer.
+    """
+    # Convert XYZ to PQ-scaled LMS in a single product.
+    y = np.asarray(xyz, dtype=float) @ _XYZ_TO_SCALED_LMS_T
 
-    # Convert XYZ to LMS using the precomputed matrix.
-    lms = np.dot(xyz_array.copy(), XYZ_TO_LMS_MATRIX.T)
-    y = lms / 10000.0
+    # Inverse non-linear transform; the signed power is shared by both terms.
+    ya = signed_power(y, m1)
+    val = c2 * ya
+    val += c1
+    ya *= c3
+    ya += 1
+    val /= ya
+    lms_prime = signed_power(val, m2, out=y)
 
-    # Inverse non-linear transform
-    val =  (c1 + c2 * np.sign(y) * np.power(np.abs(y), m1)) / (1 + c3 * np.sign(y) * np.power(np.abs(y), m1))
-    lms_prime = np.sign(val) * np.power(np.abs(val),m2)
+    return np.matmul(lms_prime, _A_T, out=out)
 
-    itp = lms_prime @ A.T
-    return itp
\ No newline at end of file
+def xyz_to_ictcp(xyz_array, **kwargs):
+    return xyz_to_ictcp_batch(xyz_array)
\ No newline at end of file
@@ -1,4 +1,5 @@
 import numpy as np
+from ._kernels import signed_power
 
 _M1_IDC = np.array([
     [  0.097351,   4.014714,   0.237031,   0.000000],
@@ -29,8 +30,9 @@ def _sa_pq_transfer(y):
     Equation: f_SA-PQ(Y) = ((c1 + c2 * Y^(m)) / (1 + c3 * Y^(m)))^(n)
      """
     c1, c2, c3, m, n = _SA_PQ_CONSTS
-    numerator = c1 + c2 * np.sign(y) * np.power(np.abs(y), m)
-    denominator = 1 + c3 * np.sign(y) * np.power(np.abs(y), m)
+    y_m = signed_power(y, m)
+    numerator = c1 + c2 * y_m
+    denominator = 1 + c3 * y_m
     val = numerator / denominator
     result = np.power(val, n)
     return result
@@ -44,11 +46,11 @@ def _sa_pq_transfer_inverse(z):
     """
     c1, c2, c3, m, n = _SA_PQ_CONSTS
     # Remove the exponent n
-    val = np.sign(z) * np.power(np.abs(z), 1.0 / n)
+    val = signed_power(z, 1.0 / n)
     
     # Solve for y^m
     y_m = (val - c1) / (c2 - c3 * val)
-    result = np.sign(y_m) * np.power(np.abs(y_m), 1.0 / m)
+    result = signed_power(y_m, 1.0 / m)
     return result
 
 def xyz_to_idc(xyz_array, **kwargs):
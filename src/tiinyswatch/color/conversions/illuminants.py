@@ -0,0 +1,34 @@
+"""CIE constants and reference white points shared by the conversion kernels."""
+import numpy as np
+
+# CIE standard constants (exact rational forms)
+CIE_E = 216.0 / 24389.0
+CIE_K = 24389.0 / 27.0
+
+# Reference white XYZ values keyed by observer angle and illuminant name
+ILLUMINANTS = {
+    '2': {
+        'a': np.array([1.09850, 1.00000, 0.35585]),
+        'b': np.array([0.99072, 1.00000, 0.85223]),
+        'c': np.array([0.98074, 1.00000, 1.18232]),
+        'd50': np.array([0.96422, 1.00000, 0.82521]),
+        'd55': np.array([0.95682, 1.00000, 0.92149]),
+        'd65': np.array([0.95047, 1.00000, 1.08883]),
+        'd75': np.array([0.94972, 1.00000, 1.22638]),
+        'e': np.array([1.00000, 1.00000, 1.00000]),
+        'f2': np.array([0.99186, 1.00000, 0.67393]),
+        'f7': np.array([0.95041, 1.00000, 1.08747]),
+        'f11': np.array([1.00962, 1.00000, 0.64350]),
+    },
+    '10': {
+        'd50': np.array([0.9672, 1.0000, 0.8143]),
+        'd55': np.array([0.9580, 1.0000, 0.9093]),
+        'd65': np.array([0.9481, 1.0000, 1.0730]),
+        'd75': np.array([0.94416, 1.0000, 1.2064]),
+    },
+}
+
+
+def get_white_point(observer="2", illuminant="d65"):
+    """Return the reference white XYZ for the given observer and illuminant."""
+    return ILLUMINANTS[str(observer)][illuminant.lower()]
@@ -1,11 +1,32 @@
-# Imports moved to colormath_wrapper for lazy loading
 import numpy as np
-from .colormath_wrapper import colormath_wrapper
+from ._kernels import signed_power
 
-@colormath_wrapper('IPTColor', 'XYZColor')
-def ipt_to_xyz(comps_array):
-    return 0
+# XYZ (D65) to LMS and LMS' to IPT matrices (Fairchild, Color Appearance Models, 3rd Ed.)
+XYZ_TO_LMS = np.array([
+    [0.4002, 0.7075, -0.0807],
+    [-0.2280, 1.1500, 0.0612],
+    [0.0000, 0.0000, 0.9184]
+])
+LMS_TO_IPT = np.array([
+    [0.4000, 0.4000, 0.2000],
+    [4.4550, -4.8510, 0.3960],
+    [0.8056, 0.3572, -1.1628]
+])
+IPT_TO_LMS = np.linalg.inv(LMS_TO_IPT)
+LMS_TO_XYZ = np.linalg.inv(XYZ_TO_LMS)
 
-@colormath_wrapper('XYZColor', 'IPTColor')
-def xyz_to_ipt(xyz_color):
-    return 0
\ No newline at end of file
+# Contiguous transposed copies for row-vector products
+_IPT_TO_LMS_T = np.ascontiguousarray(IPT_TO_LMS.T)
+_LMS_TO_XYZ_T = np.ascontiguousarray(LMS_TO_XYZ.T)
+_XYZ_TO_LMS_T = np.ascontiguousarray(XYZ_TO_LMS.T)
+_LMS_TO_IPT_T = np.ascontiguousarray(LMS_TO_IPT.T)
+
+def ipt_to_xyz(comps_array, **kwargs):
+    lms = np.asarray(comps_array, dtype=float) @ _IPT_TO_LMS_T
+    lms_linear = signed_power(lms, 1 / 0.43)
+    return lms_linear @ _LMS_TO_XYZ_T
+
+def xyz_to_ipt(xyz_color, **kwargs):
+    lms = np.asarray(xyz_color, dtype=float) @ _XYZ_TO_LMS_T
+    lms_prime = signed_power(lms, 0.43)
+    return lms_prime @ _LMS_TO_IPT_T
\ No newline at end of file
@@ -1,5 +1,5 @@
-# Imports moved to colormath_wrapper for lazy loading
 import numpy as np
+from ._kernels import signed_power
 
 # Precompute matrices used in both conversions.
 _M1_ITP = np.array([
@@ -29,6 +29,15 @@ A = np.array([
 ])
 A_inv = np.linalg.inv(A)
 
+# Contiguous transposed copies for row-vector products
+_A_INV_T = np.ascontiguousarray(A_inv.T)
+# ITP stores T at half scale; doubling row 1 of A_inv.T undoes that inside the product
+_ITP_TO_LMS_PRIME_T = _A_INV_T * np.array([[1.0], [2.0], [1.0]])
+_M3_ITP_T = np.ascontiguousarray(_M3_ITP.T)
+_LMS_TO_XYZ_T = np.ascontiguousarray(LMS_TO_XYZ.T)
+# XYZ -> LMS with the PQ 1/10000 luminance scale folded in
+_XYZ_TO_SCALED_LMS_T = np.ascontiguousarray(XYZ_TO_LMS_MATRIX.T * 1e-4)
+
 # Constants for the non-linear transforms.
 m1 = 0.1593017578125
 m2 = 78.84375
@@ -37,31 +46,40 @@ c2 = 18.8515625
 c3 = 18.6875
 
 def itp_to_xyz(itp_array, **kwargs):
-    v = itp_array.copy()
-    # Multiply the T component by 2.
-    v[1] = v[1] * 2
-
-    # Convert ITP to LMS' via matrix multiplication.
-    lms_prime = np.dot(v, A_inv.T)
+    # Convert ITP to LMS' via matrix multiplication (the T doubling is folded in,
+    # so the input is never copied or modified).
+    lms_prime = np.asarray(itp_array, dtype=float) @ _ITP_TO_LMS_PRIME_T
 
     # Apply the non-linear transform elementwise.
-    A_val = np.sign(lms_prime) * np.power(np.abs(lms_prime), 1.0 / m2)
+    A_val = signed_power(lms_prime, 1.0 / m2)
     Z = (c1 - A_val) / (A_val * c3 - c2)
-    y = np.sign(Z) * np.power(np.abs(Z), 1.0 / m1)
+    y = signed_power(Z, 1.0 / m1)
     lms = y * 10000.0
 
     # Convert LMS to XYZ via matrix multiplication.
-    xyz = np.dot(lms, LMS_TO_XYZ.T)
+    xyz = lms @ _LMS_TO_XYZ_T
     return xyz
 
-def xyz_to_itp(xyz_array, **kwargs):
-    # Convert XYZ to LMS using the precomputed matrix.
-    lms = np.dot(xyz_array.copy(), XYZ_TO_LMS_MATRIX.T)
-    y = lms / 10000.0
+def xyz_to_itp_batch(xyz, out=None):
+    """
+    Convert an (N, 3) array of XYZ rows to ITP in one pass.
+    Intermediates are updated in place; pass `out` to reuse a result buffer.
+    """
+    # Convert XYZ to PQ-scaled LMS in a single product.
+    y = np.asarray(xyz) @ _XYZ_TO_SCALED_LMS_T
 
-    # Inverse non-linear transform
-    val =  (c1 + c2 * np.sign(y) * np.power(np.abs(y), m1)) / (1 + c3 * np.sign(y) * np.power(np.abs(y), m1))
-    lms_prime = np.sign(val) * np.power(np.abs(val),m2)
+    # Inverse non-linear transform; the signed power is shared by both terms.
+    ya = signed_power(y, m1)
+    val = c2 * ya
+    val += c1
+    ya *= c3
+    ya += 1
+    val /= ya
 
-    itp = lms_prime @ _M3_ITP.T
-    return itp
\ No newline at end of file
+    # lms' = sign(val) * |val|**m2, reusing the LMS buffer
+    lms_prime = signed_power(val, m2, out=y)
+
+    return np.matmul(lms_prime, _M3_ITP_T, out=out)
+
+def xyz_to_itp(xyz_array, **kwargs):
+    return xyz_to_itp_batch(np.asarray(xyz_array)[None, :])[0]
\ No newline at end of file
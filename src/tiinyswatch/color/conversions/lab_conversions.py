@@ -1,11 +1,22 @@
-# Imports moved to colormath_wrapper for lazy loading
 import numpy as np
-from .colormath_wrapper import colormath_wrapper
+from .illuminants import CIE_E, get_white_point
 
-@colormath_wrapper('LabColor', 'XYZColor')
-def lab_to_xyz(comps_array, **kwargs):
-    return 0
+def lab_to_xyz(comps_array, observer="2", illuminant="d50", **kwargs):
+    # Scaled by the Lab color's own reference white
+    lab = np.asarray(comps_array, dtype=float)
+    fy = (lab[..., 0] + 16.0) / 116.0
+    fx = fy + lab[..., 1] / 500.0
+    fz = fy - lab[..., 2] / 200.0
+    f = np.stack([fx, fy, fz], axis=-1)
+    f3 = f ** 3
+    xyz_rel = np.where(f3 > CIE_E, f3, (f - 16.0 / 116.0) / 7.787)
+    return xyz_rel * get_white_point(observer, illuminant)
     
-@colormath_wrapper('XYZColor', 'LabColor')
-def xyz_to_lab(xyz_color, **kwargs):
-    return 0
\ No newline at end of file
+def xyz_to_lab(xyz_color, observer="2", illuminant="d50", **kwargs):
+    # XYZ is always D65-relative, so it is normalized against the D65 white
+    xyz_rel = np.asarray(xyz_color, dtype=float) / get_white_point(observer, "d65")
+    f = np.where(xyz_rel > CIE_E, np.cbrt(xyz_rel), (7.787 * xyz_rel) + (16.0 / 116.0))
+    l = (116.0 * f[..., 1]) - 16.0
+    a = 500.0 * (f[..., 0] - f[..., 1])
+    b = 200.0 * (f[..., 1] - f[..., 2])
+    return np.stack([l, a, b], axis=-1)
\ No newline at end of file
@@ -1,11 +1,41 @@
-# Imports moved to colormath_wrapper for lazy loading
 import numpy as np
-from .colormath_wrapper import colormath_wrapper
+from .illuminants import CIE_E, CIE_K, get_white_point
 
-@colormath_wrapper('LuvColor', 'XYZColor')
-def luv_to_xyz(comps_array, observer, illuminant):
-    return 0
+def _white_uv(white):
+    denom = white[0] + (15.0 * white[1]) + (3.0 * white[2])
+    return (4.0 * white[0]) / denom, (9.0 * white[1]) / denom
+
+def luv_to_xyz(comps_array, observer="2", illuminant="d50", **kwargs):
+    # Scaled by the Luv color's own reference white
+    luv = np.asarray(comps_array, dtype=float)
+    l, u, v = luv[..., 0], luv[..., 1], luv[..., 2]
+    u0, v0 = _white_uv(get_white_point(observer, illuminant))
+
+    dark = l <= 0.0
+    safe_l = np.where(dark, 1.0, l)
+    y = np.where(l > CIE_K * CIE_E, ((safe_l + 16.0) / 116.0) ** 3, safe_l / CIE_K)
+    var_u = u / (13.0 * safe_l) + u0
+    var_v = v / (13.0 * safe_l) + v0
+    x = y * 9.0 * var_u / (4.0 * var_v)
+    z = y * (12.0 - 3.0 * var_u - 20.0 * var_v) / (4.0 * var_v)
+
+    xyz = np.stack([x, y, z], axis=-1)
+    return np.where(dark[..., None], 0.0, xyz)
     
-@colormath_wrapper('XYZColor', 'LuvColor')
-def xyz_to_luv(xyz_color, observer, illuminant):
-    return 0
\ No newline at end of file
+def xyz_to_luv(xyz_color, observer="2", illuminant="d50", **kwargs):
+    # XYZ is always D65-relative, so it is normalized against the D65 white
+    xyz = np.asarray(xyz_color, dtype=float)
+    x, y, z = xyz[..., 0], xyz[..., 1], xyz[..., 2]
+    white = get_white_point(observer, "d65")
+    u0, v0 = _white_uv(white)
+
+    denom = x + (15.0 * y) + (3.0 * z)
+    empty = denom == 0.0
+    safe_denom = np.where(empty, 1.0, denom)
+    u_prime = np.where(empty, 0.0, (4.0 * x) / safe_denom)
+    v_prime = np.where(empty, 0.0, (9.0 * y) / safe_denom)
+
+    y_rel = y / white[1]
+    f = np.where(y_rel > CIE_E, np.cbrt(y_rel), (7.787 * y_rel) + (16.0 / 116.0))
+    l = (116.0 * f) - 16.0
+    return np.stack([l, 13.0 * l * (u_prime - u0), 13.0 * l * (v_prime - v0)], axis=-1)
\ No newline at end of file
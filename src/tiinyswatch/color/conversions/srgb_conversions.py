@@ -1,11 +1,39 @@
 import numpy as np
-from .colormath_wrapper import colormath_wrapper
 
-@colormath_wrapper('sRGBColor', 'XYZColor')
+# Linear sRGB to XYZ (D65) matrix
+SRGB_TO_XYZ_D65 = np.array([
+    [0.412424, 0.357579, 0.180464],
+    [0.212656, 0.715158, 0.0721856],
+    [0.0193324, 0.119193, 0.950444]
+])
+
+# XYZ (D65) to linear sRGB matrix
+XYZ_TO_SRGB_D65 = np.array([
+    [3.24071, -1.53726, -0.498571],
+    [-0.969258, 1.87599, 0.0415557],
+    [0.0556352, -0.203996, 1.05707]
+])
+
+# Contiguous transposed copies for row-vector products
+_SRGB_TO_XYZ_T = np.ascontiguousarray(SRGB_TO_XYZ_D65.T)
+_XYZ_TO_SRGB_T = np.ascontiguousarray(XYZ_TO_SRGB_D65.T)
+
+def srgb_to_linear(rgb):
+    """Remove the sRGB transfer curve."""
+    rgb = np.asarray(rgb, dtype=float)
+    return np.where(rgb <= 0.04045, rgb / 12.92, ((np.maximum(rgb, 0.04045) + 0.055) / 1.055) ** 2.4)
+
+def linear_to_srgb(linear):
+    """Apply the sRGB transfer curve."""
+    linear = np.asarray(linear, dtype=float)
+    return np.where(linear <= 0.0031308, linear * 12.92, 1.055 * np.maximum(linear, 0.0031308) ** (1 / 2.4) - 0.055)
+
 def srgb_to_xyz(comps_array, **kwargs):
     # Expected order: [r, g, b]
-    return 0
-    
-@colormath_wrapper('XYZColor', 'sRGBColor')
+    linear = srgb_to_linear(comps_array)
+    return np.maximum(linear @ _SRGB_TO_XYZ_T, 0.0)
+
 def xyz_to_srgb(xyz_color, **kwargs):
-    return 0
\ No newline at end of file
+    # Negative linear values are clipped before companding
+    linear = np.maximum(np.asarray(xyz_color, dtype=float) @ _XYZ_TO_SRGB_T, 0.0)
+    return linear_to_srgb(linear)
\ No newline at end of file
@@ -1,17 +1,24 @@
-# Imports moved to colormath_wrapper for lazy loading
 import numpy as np
-from .colormath_wrapper import colormath_wrapper
 
-@colormath_wrapper('xyYColor', 'XYZColor')
-def xyy_to_xyz(comps_array, **kwargs):
+def xyy_to_xyz(comps_array, observer="2", illuminant="d50", **kwargs):
     """
-    Not yet implemented. Instead, uses the colormath library for conversion.
+    Converts xyY to XYZ. A zero chromaticity y maps to black.
     """
-    pass
+    xyy = np.asarray(comps_array, dtype=float)
+    x, y, big_y = xyy[..., 0], xyy[..., 1], xyy[..., 2]
+    black = y == 0.0
+    safe_y = np.where(black, 1.0, y)
+    xyz = np.stack([x * big_y / safe_y, big_y, (1.0 - x - y) * big_y / safe_y], axis=-1)
+    return np.where(black[..., None], 0.0, xyz)
 
-@colormath_wrapper('XYZColor', 'xyYColor')
-def xyz_to_xyy(xyz_color, **kwargs):
+def xyz_to_xyy(xyz_color, observer="2", illuminant="d50", **kwargs):
     """
-    Not yet implemented. Instead, uses the colormath library for conversion.
+    Converts XYZ to xyY. Black keeps a zero chromaticity.
     """
-    pass
\ No newline at end of file
+    xyz = np.asarray(xyz_color, dtype=float)
+    total = xyz.sum(axis=-1)
+    black = total == 0.0
+    safe_total = np.where(black, 1.0, total)
+    x = np.where(black, 0.0, xyz[..., 0] / safe_total)
+    y = np.where(black, 0.0, xyz[..., 1] / safe_total)
+    return np.stack([x, y, xyz[..., 1]], axis=-1)
\ No newline at end of file
@@ -14,6 +14,8 @@ class ColorArc(ColorShape):
     """
     RATIONAL_PARAMS = np.array([79.79228714, 91.04641017, 342.10224362, 
                                 1140.93828543, 172.44578339, 1078.89797726])
+    # Python-float copy of RATIONAL_PARAMS for scalar evaluation
+    _RATIONAL_COEFFS = tuple(RATIONAL_PARAMS.tolist())
     
     saturation = create_var("saturation", float,
                            preview=lambda inst, val: inst.preview_saturation_value(val),
@@ -23,10 +25,31 @@ class ColorArc(ColorShape):
                       apply=lambda inst, pts, val: inst.apply_hue_value(pts, val),
                       disp_name="Hue.", default=0.0, range=(0.0, np.pi * 2.0))
     n = create_var("n", int, disp_name="Colors:", default=5, range=(1, 12))
+    ROTATION_CACHE_SIZE = 64
     
     def __init__(self, colors=None):
+        # theta -> rotation matrix about the current _arc_axis
+        self._rotation_cache = {}
+        # Saturation-independent chord frame and the endpoints/format it was built for
+        self._chord_frame_key = None
+        self._chord_frame_cache = None
         # Expecting two seed colors (for the arc endpoints)
         super().__init__(colors=colors)
+
+    def _set_arc_axis(self, axis):
+        self._arc_axis = axis
+        self._rotation_cache.clear()
+
+    def _rotate_about_arc_axis(self, points, pivot, theta):
+        """Rotate points about _arc_axis, reusing the rotation matrix for a repeated theta."""
+        R = self._rotation_cache.get(theta)
+        if R is None:
+            R = ColorGeometryTools.rodrigues_matrix(self._arc_axis, theta)
+            if len(self._rotation_cache) >= self.ROTATION_CACHE_SIZE:
+                # Evict the oldest entry
+                del self._rotation_cache[next(iter(self._rotation_cache))]
+            self._rotation_cache[theta] = R
+        return ColorGeometryTools.apply_rotation(points, pivot, R)
     
     def compute_from_seed(self, colors):
         """Compute the arc (and store auxiliary data such as arc_axis and arc_peak)
@@ -35,64 +58,34 @@ class ColorArc(ColorShape):
         # colors is expected to be [colorA, colorB]
         A = np.asarray(self.color_to_point(colors[0]), dtype=float)
         B = np.asarray(self.color_to_point(colors[1]), dtype=float)
-        chord = B - A
-        d = np.linalg.norm(chord)
+        d, arc_axis, M, u, d_ref = self._chord_frame(A, B)
         n = self.get_value("n")
         saturation_val = self.get_value("saturation")
         
         if d < 1e-12:
-            self._arc_axis = chord
+            self._set_arc_axis(B - A)
             self._arc_peak = A.copy()
             return np.tile(A, (n, 1))
         
-        self._arc_axis = chord / d
+        self._set_arc_axis(arc_axis)
         
         if math.isclose(saturation_val, 1.0, abs_tol=1e-10):
             self._arc_peak = (A + B) / 2.0
-            return np.linspace(A, B, n)
+            return ColorGeometryTools.line_points(A, B, n)
         
-        theta = self._compute_theta(saturation_val, d)
+        theta = self._compute_theta(saturation_val, d, d_ref)
         R_circle = d / (2.0 * math.sin(theta / 2.0))
-        M = (A + B) / 2.0
-        u = ColorGeometryTools.get_perpendicular_vector(self._arc_axis)
         h = math.sqrt(max(R_circle**2 - (d / 2.0)**2, 0))
         Cc = M + h * u
-        
-        vA = A - Cc
-        norm_vA = np.linalg.norm(vA)
-        e1 = vA / norm_vA if norm_vA > 1e-12 else np.zeros(3)
-        vB = B - Cc
-        proj = np.dot(vB, e1) * e1
-        vB_perp = vB - proj
-        norm_vB_perp = np.linalg.norm(vB_perp)
-        if norm_vB_perp < 1e-12:
-            e2 = np.zeros(3)
-            sweep = 0.0
-        else:
-            e2 = vB_perp / norm_vB_perp
-            dot1 = np.dot(vB, e1)
-            dot2 = np.dot(vB, e2)
-            sweep = math.atan2(dot2, dot1)
-            if sweep < 0:
-                sweep += 2 * math.pi
-        if theta > math.pi and sweep < math.pi:
-            e2 = -e2
-            sweep = 2 * math.pi - sweep
-        
-        cos_phi = np.dot(B - Cc, e1) / R_circle
-        sin_phi = np.dot(B - Cc, e2) / R_circle
-        phi_B = math.atan2(sin_phi, cos_phi)
-        if phi_B < 0:
-            phi_B += 2 * math.pi
-        if theta > math.pi and phi_B < math.pi:
-            phi_B = 2 * math.pi - phi_B
-        sweep = phi_B
+        e1, e2, sweep = self._arc_sweep(A, B, Cc, theta)
         
         angles = np.linspace(0.0, sweep, n)
-        cos_angles = np.cos(angles)
-        sin_angles = np.sin(angles)
-        shape = Cc.reshape(1, 3) + R_circle * (cos_angles.reshape(n, 1) * e1.reshape(1, 3) +
-                                                sin_angles.reshape(n, 1) * e2.reshape(1, 3))
+        # Cc + R * (cos * e1 + sin * e2), built in place in one (n, 3) buffer
+        shape = np.empty((n, 3))
+        np.multiply.outer(np.cos(angles), e1, out=shape)
+        shape += np.multiply.outer(np.sin(angles), e2)
+        shape *= R_circle
+        shape += Cc
         shape[-1, :] = B
         
         phi_peak = sweep / 2.0
@@ -100,21 +93,69 @@ class ColorArc(ColorShape):
         
         total_rotation = math.pi if theta > math.pi else 0.0
         if not math.isclose(total_rotation, 0.0, abs_tol=1e-12):
-            shape = ColorGeometryTools.rotate_points(shape, A, self._arc_axis, total_rotation)
-            self._arc_peak = ColorGeometryTools.rotate_point(self._arc_peak, A, self._arc_axis, total_rotation)
+            shape = self._rotate_about_arc_axis(shape, A, total_rotation)
+            self._arc_peak = self._rotate_about_arc_axis(self._arc_peak, A, total_rotation)
         
         return shape
 
-    def _compute_theta(self, saturation, d):
+    @staticmethod
+    def _arc_sweep(A, B, Cc, theta):
+        """
+        Return (e1, e2, sweep) for the arc about Cc from A to B: e1 points at A, e2 completes
+        the in-plane basis toward B and sweep is the angle from A to B, taken the long way
+        round when theta > pi. e1/e2 are zero vectors when the arc is degenerate.
+        """
+        vA = A - Cc
+        norm_vA = ColorGeometryTools.norm3(vA)
+        e1 = vA / norm_vA if norm_vA > 1e-12 else np.zeros(3)
+        vB = B - Cc
+        dot1 = ColorGeometryTools.dot3(vB, e1)
+        vB_perp = vB - dot1 * e1
+        norm_vB_perp = ColorGeometryTools.norm3(vB_perp)
+        if norm_vB_perp < 1e-12:
+            e2 = np.zeros(3)
+            sweep = math.atan2(0.0, dot1)
+        else:
+            e2 = vB_perp / norm_vB_perp
+            sweep = math.atan2(norm_vB_perp, dot1)
+        if theta > math.pi:
+            e2 = -e2
+            sweep = 2 * math.pi - sweep
+        return e1, e2, sweep
+
+    def _compute_theta(self, saturation, d, d_ref=None):
         if math.isclose(saturation, 1.0, abs_tol=1e-10):
             return 0.0
-        d_ref = np.linalg.norm(QColorEnhanced.get_black_point(self.format) -
-                                self.get_format_centroid())
+        if d_ref is None:
+            d_ref = ColorGeometryTools.norm3(QColorEnhanced.get_black_point(self.format) -
+                                             self.get_format_centroid())
         effective_saturation = 1 + (saturation - 1) * (d_ref / d)
         x = effective_saturation - 1.0
-        params = self.RATIONAL_PARAMS
-        theta = (params[0] * x + params[3] * x**2 + params[5] * x**3) / (1.0 + params[1] * x + params[2] * x**2 + params[4] * x**3)
-        return theta
+        p0, p1, p2, p3, p4, p5 = self._RATIONAL_COEFFS
+        # Horner form of (p0 x + p3 x^2 + p5 x^3) / (1 + p1 x + p2 x^2 + p4 x^3)
+        numerator = x * (p0 + x * (p3 + x * p5))
+        denominator = 1.0 + x * (p1 + x * (p2 + x * p4))
+        return numerator / denominator
+
+    def _chord_frame(self, A, B):
+        """
+        Return (d, arc_axis, M, u, d_ref) for the chord A -> B. None of it depends on
+        saturation, so compute_from_seed and the saturation preview share one copy that
+        is rebuilt only when the endpoints or format change.
+        """
+        key = (A.tobytes(), B.tobytes(), self.format)
+        if key != self._chord_frame_key:
+            chord = B - A
+            d = ColorGeometryTools.norm3(chord)
+            arc_axis = u = None
+            if d >= 1e-12:
+                arc_axis = chord / d
+                u = ColorGeometryTools.get_perpendicular_vector(arc_axis)
+            M = (A + B) / 2.0
+            d_ref = ColorGeometryTools.norm3(QColorEnhanced.get_black_point(self.format) - self.get_format_centroid())
+            self._chord_frame_cache = (d, arc_axis, M, u, d_ref)
+            self._chord_frame_key = key
+        return self._chord_frame_cache
 
     def preview_saturation_value(self, saturation):
         """
@@ -125,52 +166,29 @@ class ColorArc(ColorShape):
             return np.array([0.0, 0.0, 0.0])
         A = self._shape[0]
         B = self._shape[-1]
-        chord = B - A
-        d = np.linalg.norm(chord)
+        d, arc_axis, M, u, d_ref = self._chord_frame(A, B)
         
         if d < 1e-12:
-            return A
+            return A.copy()
         
         if math.isclose(saturation, 1.0, abs_tol=1e-10):
             return (A + B) / 2.0
         
-        arc_axis = chord / d
-        d_ref = np.linalg.norm(QColorEnhanced.get_black_point(self.format) - self.get_format_centroid())
-        effective_saturation = 1 + (saturation - 1) * (d_ref / d)
-        x = effective_saturation - 1.0
-        params = self.RATIONAL_PARAMS
-        theta = (params[0] * x + params[3] * x**2 + params[5] * x**3) / (1.0 + params[1] * x + params[2] * x**2 + params[4] * x**3)
+        theta = self._compute_theta(saturation, d, d_ref)
         R_circle = d / (2.0 * math.sin(theta / 2.0))
-        M = (A + B) / 2.0
-        u = ColorGeometryTools.get_perpendicular_vector(arc_axis)
         h = math.sqrt(max(R_circle**2 - (d / 2.0)**2, 0))
         Cc = M + h * u
         
-        vA = A - Cc
-        norm_vA = np.linalg.norm(vA)
-        if norm_vA < 1e-12:
+        e1, e2, sweep = self._arc_sweep(A, B, Cc, theta)
+        if not (e1.any() and e2.any()):
             return (A + B) / 2.0
-        e1 = vA / norm_vA
-        vB = B - Cc
-        proj = np.dot(vB, e1) * e1
-        vB_perp = vB - proj
-        norm_vB_perp = np.linalg.norm(vB_perp)
-        if norm_vB_perp < 1e-12:
-            return (A + B) / 2.0
-        e2 = vB_perp / norm_vB_perp
-        sweep = math.atan2(np.linalg.norm(vB_perp), np.dot(vB, e1))
-        if sweep < 0:
-            sweep += 2 * math.pi
-        if theta > math.pi and sweep < math.pi:
-            e2 = -e2
-            sweep = 2 * math.pi - sweep
 
         phi_peak = sweep / 2.0
         arc_peak = Cc + R_circle * (math.cos(phi_peak) * e1 + math.sin(phi_peak) * e2)
 
         if theta > math.pi:
             v_peak = arc_peak - A
-            rotated_v_peak = 2 * np.dot(v_peak, arc_axis) * arc_axis - v_peak
+            rotated_v_peak = 2 * ColorGeometryTools.dot3(v_peak, arc_axis) * arc_axis - v_peak
             arc_peak = A + rotated_v_peak
 
         return arc_peak
@@ -179,10 +197,10 @@ class ColorArc(ColorShape):
         """
         Return a preview of the arc_peak after rotating by hue.
         """
-        return ColorGeometryTools.rotate_point(self._arc_peak, self._shape[0], self._arc_axis, hue)
+        return self._rotate_about_arc_axis(self._arc_peak, self._shape[0], hue)
 
     def apply_hue_value(self, points, theta_radians):
         """
         Apply a hue rotation to the given points (without recomputing the arc).
         """
-        return ColorGeometryTools.rotate_points(points, self._shape[0], self._arc_axis, theta_radians)
+        return self._rotate_about_arc_axis(points, self._shape[0], theta_radians)
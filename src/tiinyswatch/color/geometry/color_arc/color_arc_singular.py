@@ -3,6 +3,8 @@ from tiinyswatch.color.color_enhanced import QColorEnhanced
 from tiinyswatch.color.geometry.color_geometry_tools import ColorGeometryTools
 from tiinyswatch.color.geometry.color_arc.color_arc import ColorArc
 class ColorArcSingular(ColorArc):
+    # Hue rotations of the single-seed arc always turn about the lightness axis
+    HUE_AXIS = np.array([1.0, 0.0, 0.0])
     
     def __init__(self, colors=None):
         super().__init__(colors=colors)
@@ -15,19 +17,19 @@ class ColorArcSingular(ColorArc):
         P = np.asarray(self.color_to_point(color), dtype=float)
         fixed_A = QColorEnhanced.get_white_point(self.format)
         fixed_B = QColorEnhanced.get_black_point(self.format)
-        d_fixed = np.linalg.norm(fixed_B - fixed_A)
+        d_fixed = ColorGeometryTools.norm3(fixed_B - fixed_A)
         if d_fixed < 1e-12:
             self._shape = np.tile(P, (n, 1))
-            self._arc_axis = np.zeros(3)
+            self._set_arc_axis(np.zeros(3))
             self._arc_peak = P
             return self._shape
 
         u = np.array([-1.0, -saturation_val/3.0, saturation_val/3.0])
-        u = u / np.linalg.norm(u)
+        u = u / ColorGeometryTools.norm3(u)
         A = P - ((d_fixed/3.0*saturation_val)/2.0) * u
         B = P + ((d_fixed/3.0*saturation_val)/2.0) * u
-        self._shape = np.linspace(A, B, n)
-        self._arc_axis = u
+        self._shape = ColorGeometryTools.line_points(A, B, n)
+        self._set_arc_axis(u)
         self._arc_peak = P
         return self._shape
 
@@ -35,12 +37,12 @@ class ColorArcSingular(ColorArc):
         P = self._arc_peak
         fixed_A = QColorEnhanced.get_white_point(self.format)
         fixed_B = QColorEnhanced.get_black_point(self.format)
-        d_fixed = np.linalg.norm(fixed_B - fixed_A) / 3.0 * saturation
+        d_fixed = ColorGeometryTools.norm3(fixed_B - fixed_A) / 3.0 * saturation
         if d_fixed < 1e-12:
             return self.arc_peak
         
         u = np.array([-1.0, -saturation/3.0, saturation/3.0])
-        u = u / np.linalg.norm(u)
+        u = u / ColorGeometryTools.norm3(u)
         A = P - (d_fixed/2.0) * u
         
         # Compute the rotation axis from the current shape's endpoints relative to arc_peak
@@ -60,9 +62,7 @@ class ColorArcSingular(ColorArc):
         P = self._arc_peak
         A = self._shape[0]
 
-        axis = np.array([1.0, 0.0, 0.0])
-
-        return ColorGeometryTools.rotate_point(A, P, axis, hue)
+        return ColorGeometryTools.rotate_point(A, P, self.HUE_AXIS, hue)
         
     def apply_hue_value(self, points, theta_radians: float):
         """
@@ -73,8 +73,6 @@ class ColorArcSingular(ColorArc):
         """
         P = self._arc_peak
 
-        axis = np.array([1.0, 0.0, 0.0])
-
-        new_shape = ColorGeometryTools.rotate_points(points, P, axis, theta_radians)
+        new_shape = ColorGeometryTools.rotate_points(points, P, self.HUE_AXIS, theta_radians)
 
         return new_shape
\ No newline at end of file
@@ -1,13 +1,35 @@
+import math
 import numpy as np
 
 class ColorGeometryTools:
+    # Reference axes for get_perpendicular_vector; never modified
+    _Z_AXIS = np.array([0.0, 0.0, 1.0])
+    _Y_AXIS = np.array([0.0, 1.0, 0.0])
+
+    @staticmethod
+    def norm3(v: np.ndarray) -> float:
+        """
+        Euclidean length of a 3-vector, computed on Python floats to skip numpy's dispatch overhead.
+        """
+        x, y, z = v.tolist()
+        return math.sqrt(x * x + y * y + z * z)
+
+    @staticmethod
+    def dot3(u: np.ndarray, v: np.ndarray) -> float:
+        """
+        Dot product of two 3-vectors, computed on Python floats.
+        """
+        a, b, c = u.tolist()
+        x, y, z = v.tolist()
+        return a * x + b * y + c * z
+
     @staticmethod
     def rotation_matrix(axis: np.ndarray, theta: float) -> np.ndarray:
         """
         Compute the rotation matrix using Rodrigues' rotation formula.
         """
         axis = np.asarray(axis, dtype=float)
-        axis /= np.linalg.norm(axis)
+        axis /= ColorGeometryTools.norm3(axis)
         a = np.cos(theta)
         b = np.sin(theta)
         K = np.array([[0, -axis[2], axis[1]],
@@ -16,19 +38,49 @@ class ColorGeometryTools:
         I = np.eye(3)
         return a * I + b * K + (1 - a) * np.outer(axis, axis)
 
+    @staticmethod
+    def rodrigues_matrix(axis: np.ndarray, theta: float) -> np.ndarray:
+        """
+        Build the Rodrigues rotation matrix for an axis that is already normalized.
+        theta is a single angle, so libm's scalar cos/sin are used instead of numpy's ufuncs.
+        """
+        cos_r = math.cos(theta)
+        sin_r = math.sin(theta)
+        K = np.array([[0.0, -axis[2], axis[1]],
+                      [axis[2], 0.0, -axis[0]],
+                      [-axis[1], axis[0], 0.0]])
+        return cos_r * np.eye(3) + sin_r * K + (1 - cos_r) * np.outer(axis, axis)
+
     @staticmethod
     def rotate_points(points: np.ndarray, pivot: np.ndarray, axis: np.ndarray, theta: float) -> np.ndarray:
         """
         Rotate an array of points (n x 3) around a pivot along the specified axis
-        using Rodrigues' rotation formula.
-        """
-        v = points - pivot
-        cos_r = np.cos(theta)
-        sin_r = np.sin(theta)
-        dot_vals = np.sum(v * axis, axis=1, keepdims=True)
-        cross_vals = np.cross(axis, v)
-        rotated_v = v * cos_r + cross_vals * sin_r + axis * dot_vals * (1 - cos_r)
-        return pivot + rotated_v
+        using Rodrigues' rotation formula. The rotation matrix is built once and
+        applied to every point with a single matrix multiply.
+        """
+        R = ColorGeometryTools.rodrigues_matrix(axis, theta)
+        return ColorGeometryTools.apply_rotation(points, pivot, R)
+
+    @staticmethod
+    def apply_rotation(points: np.ndarray, pivot: np.ndarray, R: np.ndarray) -> np.ndarray:
+        """
+        Rotate points (n x 3, or a single point) around a pivot with a precomputed rotation matrix.
+        """
+        return pivot + (points - pivot) @ R.T
+
+    @staticmethod
+    def line_points(A: np.ndarray, B: np.ndarray, n: int) -> np.ndarray:
+        """
+        Return n evenly spaced points from A to B (inclusive) as an (n, 3) array.
+        Equivalent to np.linspace(A, B, n) but built in one preallocated buffer.
+        """
+        t = np.linspace(0.0, 1.0, n)
+        points = np.empty((n, 3))
+        np.multiply.outer(t, B - A, out=points)
+        points += A
+        if n > 1:
+            points[-1] = B
+        return points
 
     @staticmethod
     def rotate_point(point: np.ndarray, pivot: np.ndarray, axis: np.ndarray, theta: float) -> np.ndarray:
@@ -42,11 +94,12 @@ class ColorGeometryTools:
         """
         Given a normalized vector, return another unit vector perpendicular to it.
         """
-        arbitrary = np.array([0.0, 0.0, 1.0])
-        if np.abs(np.dot(vector, arbitrary)) > 0.99:
-            arbitrary = np.array([0.0, 1.0, 0.0])
-        perp = arbitrary - np.dot(arbitrary, vector) * vector
-        norm = np.linalg.norm(perp)
+        # vector . z is just its z component; only fall back to y when nearly parallel
+        arbitrary = ColorGeometryTools._Z_AXIS
+        if abs(vector[2]) > 0.99:
+            arbitrary = ColorGeometryTools._Y_AXIS
+        perp = arbitrary - ColorGeometryTools.dot3(arbitrary, vector) * vector
+        norm = ColorGeometryTools.norm3(perp)
         if norm < 1e-12:
             return np.array([1.0, 0.0, 0.0])
         return perp / norm
@@ -58,7 +111,7 @@ class ColorGeometryTools:
         If the two vectors are nearly parallel (or one is zero), returns a default axis.
         """
         axis = np.cross(vA, vB)
-        norm_axis = np.linalg.norm(axis)
+        norm_axis = ColorGeometryTools.norm3(axis)
         if norm_axis < 1e-12:
             return np.array([1.0, 0.0, 0.0])
         return axis / norm_axis
@@ -66,7 +119,7 @@ class ColorGeometryTools:
     @staticmethod
     def get_normalized_direction(vA, vB):
         direction = vB-vA
-        norm_axis = np.linalg.norm(direction)
+        norm_axis = ColorGeometryTools.norm3(direction)
         if norm_axis < 1e-12:
             return np.array([1.0, 0.0, 0.0])
         return direction/norm_axis
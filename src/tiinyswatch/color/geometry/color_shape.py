@@ -1,6 +1,7 @@
 import numpy as np
 import copy
 from tiinyswatch.color.color_enhanced import QColorEnhanced
+from tiinyswatch.color.geometry.color_geometry_tools import ColorGeometryTools
 
 # -------------------------------------------------------------------
 # Variable support classes and helper functions
@@ -116,7 +117,8 @@ class ColorShape(metaclass=ColorShapeMeta):
         self._shape = self.compute_from_seed(self._color_seed)
 
     def color_to_point(self, color) -> np.ndarray:
-        return color.get_tuple(self.format)
+        # Shapes keep their points, so take a copy of the color's read-only view
+        return color.get_tuple(self.format).copy()
 
     def point_to_color(self, point: np.ndarray):
         args = {self.format: point}
@@ -156,7 +158,7 @@ class ColorShape(metaclass=ColorShapeMeta):
         return QColorEnhanced.get_centroid(self.format)
     
     def get_distance_from_black_to_white(self):
-        distance = np.linalg.norm(QColorEnhanced.get_white_point(self.format) - QColorEnhanced.get_black_point(self.format))
+        distance = ColorGeometryTools.norm3(QColorEnhanced.get_white_point(self.format) - QColorEnhanced.get_black_point(self.format))
         return distance
 
     # Subclasses must implement this
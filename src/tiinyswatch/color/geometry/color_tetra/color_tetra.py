@@ -30,15 +30,10 @@ class ColorTetra(ColorShape):
         
         centroid_simplex = np.mean(simplex_scaled, axis=0)
         centroid_color = self.get_format_centroid()
-        best_index = None
-        best_distance = None
-        for i in range(simplex_scaled.shape[0]):
-            translation = A - simplex_scaled[i]
-            new_centroid = centroid_simplex + translation
-            d = np.linalg.norm(new_centroid - centroid_color)
-            if best_distance is None or d < best_distance:
-                best_distance = d
-                best_index = i
+        # Anchor A on each vertex in turn and keep the one whose translated centroid
+        # lands closest to the format centroid (squared distances, one einsum)
+        offsets = (centroid_simplex + A - centroid_color) - simplex_scaled
+        best_index = int(np.argmin(np.einsum('ij,ij->i', offsets, offsets)))
         
         translation = A - simplex_scaled[best_index]
         simplex_translated = simplex_scaled + translation
@@ -46,29 +41,33 @@ class ColorTetra(ColorShape):
         current_centroid = np.mean(simplex_translated, axis=0)
         v_current = current_centroid - A
         v_target = centroid_color - A
-        norm_v_current = np.linalg.norm(v_current)
-        norm_v_target = np.linalg.norm(v_target)
+        norm_v_current = ColorGeometryTools.norm3(v_current)
+        norm_v_target = ColorGeometryTools.norm3(v_target)
         
+        # The alignment and hue rotations both pivot on A, so they are composed
+        # into one matrix and applied to the simplex once
+        R_align = np.eye(3)
         if norm_v_current > 1e-12 and norm_v_target > 1e-12:
             v_current_norm = v_current / norm_v_current
             v_target_norm = v_target / norm_v_target
-            dot_val = np.dot(v_current_norm, v_target_norm)
+            dot_val = ColorGeometryTools.dot3(v_current_norm, v_target_norm)
             if not np.isclose(dot_val, 1.0):
                 axis_align = np.cross(v_current_norm, v_target_norm)
-                axis_norm = np.linalg.norm(axis_align)
+                axis_norm = ColorGeometryTools.norm3(axis_align)
                 if axis_norm > 1e-12:
                     axis_align /= axis_norm
                     angle_align = np.arccos(np.clip(dot_val, -1.0, 1.0))
-                    # Rotate the simplex around A by the alignment angle.
-                    simplex_translated = ColorGeometryTools.rotate_points(simplex_translated, A, axis_align, angle_align)
+                    # Rotation around A by the alignment angle.
+                    R_align = ColorGeometryTools.rodrigues_matrix(axis_align, angle_align)
 
         rotation_axis = centroid_color - A
-        norm_axis = np.linalg.norm(rotation_axis)
+        norm_axis = ColorGeometryTools.norm3(rotation_axis)
         if norm_axis < 1e-12:
             rotation_axis = np.array([1.0, 0.0, 0.0])
         else:
             rotation_axis /= norm_axis
         
-        simplex_final = ColorGeometryTools.rotate_points(simplex_translated, A, rotation_axis, hue)
+        R_hue = ColorGeometryTools.rodrigues_matrix(rotation_axis, hue)
+        simplex_final = ColorGeometryTools.apply_rotation(simplex_translated, A, R_hue @ R_align)
         
         return simplex_final
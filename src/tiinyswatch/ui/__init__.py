@@ -1,9 +1,16 @@
 """UI components for the TiinySwatch application."""
 
-from .dialogs import TransparentOverlay
-from .widgets import ColorPicker, HistoryPalette
-from .menus import SettingsMenu
-from .styles import SliderProxyStyle
+import importlib
+
+# Exports are resolved on first access (PEP 562), so importing one UI module
+# doesn't drag in every dialog and widget tree at startup.
+_LAZY_EXPORTS = {
+    'TransparentOverlay': '.dialogs',
+    'ColorPicker': '.widgets',
+    'HistoryPalette': '.widgets',
+    'SettingsMenu': '.menus',
+    'SliderProxyStyle': '.styles',
+}
 
 __all__ = [
     'TransparentOverlay',
@@ -11,4 +18,17 @@ __all__ = [
     'HistoryPalette',
     'SettingsMenu',
     'SliderProxyStyle'
-] 
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
\ No newline at end of file
@@ -3,6 +3,12 @@ from tiinyswatch.ui.widgets.color_widgets import ColorBlock, LineEdit
 from tiinyswatch.color import QColorEnhanced
 from tiinyswatch.utils.pantone_data import PantoneData
 from PySide6.QtWidgets import QWidget
+from PySide6.QtCore import QTimer
+
+# How often to retry a Pantone lookup while the data is still loading in the background
+LOADING_RETRY_MS = 100
+PLACEHOLDER_TEXT = "Enter Pantone name"
+LOADING_PLACEHOLDER_TEXT = "Loading Pantone colors..."
 
 class PantoneControl(ColorControl):
     """
@@ -16,7 +22,13 @@ class PantoneControl(ColorControl):
         self.preview = ColorBlock(QColorEnhanced(), parent=parent, on_click=self.handle_block_click)
         self.preview.setFixedSize(40, 25)
         self.text_input = LineEdit(parent)
-        self.text_input.setPlaceholderText("Enter Pantone name")
+        self.text_input.setPlaceholderText(PLACEHOLDER_TEXT)
+        # One pending retry while the data loads; it always uses the latest color
+        self.pending_color = None
+        self.retry_timer = QTimer(self.text_input)
+        self.retry_timer.setSingleShot(True)
+        self.retry_timer.setInterval(LOADING_RETRY_MS)
+        self.retry_timer.timeout.connect(self.retry_update)
         self.widgets = [self.preview, self.text_input]
         return self.widgets
     
@@ -26,6 +38,17 @@ class PantoneControl(ColorControl):
         self.update_widgets(color)
 
     def update_widgets(self, color):
+        if PantoneData.is_loading():
+            # Don't block the UI thread on the background load; try again shortly
+            self.text_input.setEnabled(False)
+            self.text_input.setPlaceholderText(LOADING_PLACEHOLDER_TEXT)
+            self.pending_color = color
+            self.retry_timer.start()
+            return
+        self.pending_color = None
+        if not self.text_input.isEnabled():
+            self.text_input.setEnabled(True)
+            self.text_input.setPlaceholderText(PLACEHOLDER_TEXT)
         pantone_name = self.get_value(color)
         xyz_color = PantoneData.get_xyz(pantone_name)
         if xyz_color:
@@ -37,6 +60,10 @@ class PantoneControl(ColorControl):
             self.text_input.setText(pantone_name or "")
             self.text_input.blockSignals(False)
 
+    def retry_update(self):
+        if self.pending_color is not None:
+            self.update_widgets(self.pending_color)
+
     def connect_signals(self, on_value_changed):
         super().connect_signals(on_value_changed)
         self.text_input.textEdited.connect(lambda text: on_value_changed(text.strip()))
@@ -1,8 +1,25 @@
 """Dialog components for the TiinySwatch application."""
 
-from .transparent_overlay import TransparentOverlay
-from .keybind_dialog import KeybindDialog
+import importlib
+
+# Resolved on first access (PEP 562) so the tray menu's KeybindDialog import
+# doesn't also load the screen-capture overlay.
+_LAZY_EXPORTS = {
+    'TransparentOverlay': '.transparent_overlay',
+    'KeybindDialog': '.keybind_dialog',
+}
 
 __all__ = ['TransparentOverlay', 'KeybindDialog']
 
-# This will import TransparentOverlay once it's moved 
\ No newline at end of file
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
\ No newline at end of file
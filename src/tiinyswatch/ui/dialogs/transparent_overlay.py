@@ -1,12 +1,30 @@
-from PySide6.QtCore import Qt, QRect, QPoint, QPointF, QSize
+import sys
+import numpy as np
+from PySide6.QtCore import Qt, QRect, QPoint, QPointF, QSize, QTimer
 from PySide6.QtWidgets import QApplication, QDialog
-from PySide6.QtGui import QPainter, QCursor, QColor, QPixmap, QPen
+from PySide6.QtGui import QPainter, QCursor, QColor, QPixmap, QPen, QBrush, QImage, QRegion
 from PySide6 import QtWidgets
 from tiinyswatch.utils.settings import Settings
 from tiinyswatch.utils.clipboard_manager import ClipboardManager
 from tiinyswatch.color import QColorEnhanced
 
 class TransparentOverlay(QDialog):
+    # Mouse moves are coalesced into at most one repaint per frame (~60 Hz).
+    UPDATE_INTERVAL_MS = 16
+    # Room reserved to the right of the color boxes for the hex label.
+    COLOR_LABEL_WIDTH = 160
+    COLOR_SQUARE_SIZE = 25
+    COLOR_SQUARE_SPACING = 5
+
+    # Paint resources shared by every frame.
+    DIM_COLOR = QColor(0, 0, 0, 100)
+    SELECTION_PEN = QPen(Qt.white, 1)
+    SELECTION_BRUSH = QBrush(QColor(255, 255, 255, 50))
+    ZOOM_BORDER_PEN = QPen(QColor(255, 255, 255, 100), 1)
+    ZOOM_HIGHLIGHT_PEN = QPen(Qt.red, 2)
+    ZOOM_SELECTION_PEN = QPen(Qt.yellow, 2)
+    COLOR_BOX_PEN = QPen(Qt.white, 2)
+
     def __init__(self, parent=None, screenshot=None, target_screen=None):
         super().__init__(parent, objectName="TransparentOverlay")
         self.setModal(False)
@@ -26,6 +44,21 @@ class TransparentOverlay(QDialog):
             self.screenshot_pixmap = QPixmap.fromImage(screenshot)
         else:
             self.screenshot_pixmap = screenshot
+        # (H, W, 3) RGB view of the screenshot for vectorized sampling; the
+        # QImage is kept alive because the array borrows its buffer.
+        self.screenshot_image = None
+        self.screenshot_pixels = None
+        if self.screenshot_pixmap:
+            image = self.screenshot_pixmap.toImage()
+            # Screen grabs are normally RGB32 already; only convert (once) when they are not
+            if image.format() not in (QImage.Format_RGB32, QImage.Format_ARGB32):
+                image = image.convertToFormat(QImage.Format_RGB32)
+            self.screenshot_image = image
+            rowPixels = image.bytesPerLine() // 4
+            pixels = np.frombuffer(image.constBits(), dtype=np.uint8).reshape(
+                image.height(), rowPixels, 4)[:, :image.width()]
+            # Each pixel is a 0xAARRGGBB word: bytes B, G, R, A on little-endian hosts
+            self.screenshot_pixels = pixels[..., 2::-1] if sys.byteorder == 'little' else pixels[..., 1:]
         
         self.dragging = False
         # Store positions in overlay-local physical pixels.
@@ -34,6 +67,8 @@ class TransparentOverlay(QDialog):
         self.dpr = self.screenshot_pixmap.devicePixelRatio()
         self.cursorPos = self.getGlobalUpscaledCursorPosition(QCursor.pos())
         self.averageColor = None
+        # Set when the selection changes; the average is resampled at most once per repaint.
+        self.averageDirty = False
         self.selectedColors = []
 
         QApplication.setOverrideCursor(Qt.CrossCursor)
@@ -53,6 +88,17 @@ class TransparentOverlay(QDialog):
         # The virtual cursor is computed on the fly via our helper.
         self.virtualCursorPos = None
 
+        # Repaints triggered by mouse moves only invalidate the cursor-dependent
+        # overlay (selection, zoom preview, color boxes) at its old and new spots.
+        self.lastOverlayRegion = QRegion()
+        # Screenshot with the dim layer already applied, keyed by (size, device pixel ratio)
+        self.backgroundCache = None
+        self.backgroundCacheKey = None
+        self.updateTimer = QTimer(self)
+        self.updateTimer.setSingleShot(True)
+        self.updateTimer.setInterval(self.UPDATE_INTERVAL_MS)
+        self.updateTimer.timeout.connect(self.doUpdate)
+
     def computeVirtualCursorRatio(self, zoomFactor):
         return 1.5 / zoomFactor
 
@@ -79,6 +125,7 @@ class TransparentOverlay(QDialog):
             else:
                 self.startPos = self.getEventUpscaledCursorPosition(event)
             self.endPos = self.startPos
+            self.averageDirty = True
             event.accept()
         elif event.button() == Qt.RightButton:
             self.close()
@@ -115,14 +162,37 @@ class TransparentOverlay(QDialog):
                 self.endPos = self.roundedPoint(self.virtualCursorPos)
             else:
                 self.endPos = self.getEventUpscaledCursorPosition(event)
-            # Calculate average color in real-time while dragging
+            # The live average is recomputed once per coalesced repaint in doUpdate
+            self.averageDirty = True
+        if not self.updateTimer.isActive():
+            self.updateTimer.start()
+
+    def overlayRegion(self):
+        """Return the widget-local region covered by everything that follows the cursor."""
+        cursorLocal = self.physicalToLocalLogical(self.cursorPos)
+        region = QRegion(self.colorBoxesRect(cursorLocal))
+        if self.zoomActivated and self.zoomFactor > 1:
+            previewRect = QRect(cursorLocal.x() - self.zoomSize // 2, cursorLocal.y() - self.zoomSize // 2,
+                                self.zoomSize, self.zoomSize)
+            region = region.united(previewRect.adjusted(-2, -2, 2, 2))
+        if self.dragging and self.startPos and self.endPos:
+            selectionRect = QRect(self.physicalToLocalLogical(self.startPos),
+                                  self.physicalToLocalLogical(self.endPos)).normalized()
+            region = region.united(selectionRect.adjusted(-2, -2, 2, 2))
+        return region
+
+    def doUpdate(self):
+        if self.averageDirty:
             self.calculateAverageColor()
-        self.update()
+        region = self.overlayRegion()
+        self.update(region.united(self.lastOverlayRegion))
+        self.lastOverlayRegion = region
 
     def mouseReleaseEvent(self, event):
         if event.button() == Qt.LeftButton and self.dragging:
             self.dragging = False
-            self.calculateAverageColor()
+            if self.averageDirty:
+                self.calculateAverageColor()
             modifiers = QtWidgets.QApplication.keyboardModifiers()
             
             # Check if we have an average color from a selection
@@ -180,32 +250,40 @@ class TransparentOverlay(QDialog):
     def calculateAverageColor(self):
         if not self.startPos or not self.endPos:
             return
+        self.averageDirty = False
+        if self.screenshot_pixels is None:
+            self.averageColor = QColor(0, 0, 0)
+            return
         rect = self.inclusiveRectFromPoints(self.startPos, self.endPos)
 
-        totalR = totalG = totalB = 0
-        count = 0
+        # Sample a grid of about 10x10 points (clamped to the screenshot like
+        # getPixelColor) and reduce it in one NumPy pass.
+        height, width = self.screenshot_pixels.shape[:2]
+        left, top, right, bottom = rect.left(), rect.top(), rect.right(), rect.bottom()
         stepX = max(rect.width() // 10, 1)
         stepY = max(rect.height() // 10, 1)
-        for x in range(rect.left(), rect.right() + 1, stepX):
-            for y in range(rect.top(), rect.bottom() + 1, stepY):
-                color = self.getPixelColor(QPoint(x, y))
-                totalR += color.red()
-                totalG += color.green()
-                totalB += color.blue()
-                count += 1
+        if left >= 0 and top >= 0 and right < width and bottom < height:
+            # Strided view straight into the screenshot buffer, no gather copy
+            samples = self.screenshot_pixels[top:bottom + 1:stepY, left:right + 1:stepX, :3]
+        else:
+            xs = np.clip(np.arange(left, right + 1, stepX), 0, width - 1)
+            ys = np.clip(np.arange(top, bottom + 1, stepY), 0, height - 1)
+            samples = self.screenshot_pixels[np.ix_(ys, xs)][..., :3]
+        count = samples.shape[0] * samples.shape[1]
         if count > 0:
-            avgR = totalR // count
-            avgG = totalG // count
-            avgB = totalB // count
+            # The grid holds at most a few hundred samples, so a uint32 sum cannot overflow
+            avgR, avgG, avgB = (samples.sum(axis=(0, 1), dtype=np.uint32) // count).tolist()
             self.averageColor = QColor(avgR, avgG, avgB)
 
     def getPixelColor(self, point):
-        if not self.screenshot_pixmap:
+        if self.screenshot_pixels is None:
             return QColor(0, 0, 0)
-        physicalPoint = QPoint(round(point.x()), round(point.y()))
-        x = max(0, min(physicalPoint.x(), self.screenshot_pixmap.width() - 1))
-        y = max(0, min(physicalPoint.y(), self.screenshot_pixmap.height() - 1))
-        return self.screenshot_pixmap.toImage().pixelColor(x, y)
+        height, width = self.screenshot_pixels.shape[:2]
+        x = max(0, min(round(point.x()), width - 1))
+        y = max(0, min(round(point.y()), height - 1))
+        # Read straight from the cached buffer instead of converting the pixmap per call
+        r, g, b = self.screenshot_pixels[y, x, :3].tolist()
+        return QColor(r, g, b)
 
     def drawZoomPreview(self, painter):
         if not self.screenshot_pixmap:
@@ -230,11 +308,12 @@ class TransparentOverlay(QDialog):
         previewPos = QPoint(localCursor.x() - self.zoomSize // 2,
                             localCursor.y() - self.zoomSize // 2)
         previewRect = QRect(previewPos, QSize(self.zoomSize, self.zoomSize))
+        # The zoomed screenshot is opaque: copy it instead of alpha-blending
+        painter.setCompositionMode(QPainter.CompositionMode_Source)
         painter.drawPixmap(previewRect, zoomedImage)
+        painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
 
-        borderPen = QPen(QColor(255, 255, 255, 100))
-        borderPen.setWidth(1)
-        painter.setPen(borderPen)
+        painter.setPen(self.ZOOM_BORDER_PEN)
         painter.drawRect(previewRect)
 
         scaleFactor = physicalZoomSize / srcSize
@@ -248,9 +327,7 @@ class TransparentOverlay(QDialog):
             max(1, round(pixelRight) - round(pixelLeft)),
             max(1, round(pixelBottom) - round(pixelTop))
         )
-        highlightPen = QPen(Qt.red)
-        highlightPen.setWidth(2)
-        painter.setPen(highlightPen)
+        painter.setPen(self.ZOOM_HIGHLIGHT_PEN)
         painter.drawRect(highlightRect)
 
         if self.dragging and self.startPos and self.endPos:
@@ -267,40 +344,73 @@ class TransparentOverlay(QDialog):
                     max(1, round(selRight) - round(selLeft)),
                     max(1, round(selBottom) - round(selTop))
                 )
-                selectionPen = QPen(Qt.yellow)
-                selectionPen.setWidth(2)
-                painter.setPen(selectionPen)
+                painter.setPen(self.ZOOM_SELECTION_PEN)
                 painter.drawRect(selPreviewRect)
 
+    def colorBoxesRect(self, cursorLocal):
+        """Bounding rect of drawColorBoxes, including pen width and the label."""
+        color_square_size = self.COLOR_SQUARE_SIZE
+        color_square_spacing = self.COLOR_SQUARE_SPACING
+        n_colors = len(self.selectedColors) + 1
+        initial_offset = cursorLocal.y() - (n_colors * color_square_size + color_square_spacing)/2.0
+        return QRect(cursorLocal.x() + 15 - 2, int(initial_offset) - 2,
+                     self.COLOR_LABEL_WIDTH, n_colors * (color_square_size + color_square_spacing) + 25)
+
+    def fillOpaque(self, painter, rect, color):
+        """Fill with an opaque color as a straight copy, skipping per-pixel blending."""
+        painter.setCompositionMode(QPainter.CompositionMode_Source)
+        painter.fillRect(rect, color)
+        painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
+
     def drawColorBoxes(self, painter, cursorLocal, displayColor, colorLabel):
-        color_square_size = 25
-        color_square_spacing = 5
+        color_square_size = self.COLOR_SQUARE_SIZE
+        color_square_spacing = self.COLOR_SQUARE_SPACING
         n_colors = len(self.selectedColors) + 1
         initial_offset = cursorLocal.y() - (n_colors * color_square_size + color_square_spacing)/2.0
         for i, color in enumerate(self.selectedColors):
             color_rect = QRect(cursorLocal.x() + 15, initial_offset + i * (color_square_size + color_square_spacing), color_square_size, color_square_size)
-            painter.fillRect(color_rect, color.qcolor)
-            painter.setPen(QPen(Qt.white, 2))
+            self.fillOpaque(painter, color_rect, color.qcolor)
+            painter.setPen(self.COLOR_BOX_PEN)
             painter.drawRect(color_rect)
         colorBox = QRect(cursorLocal.x() + 15, initial_offset + (n_colors - 1) * (color_square_size + color_square_spacing), color_square_size, color_square_size)
-        painter.fillRect(colorBox, displayColor)
-        painter.setPen(QPen(Qt.white, 2))
+        self.fillOpaque(painter, colorBox, displayColor)
+        painter.setPen(self.COLOR_BOX_PEN)
         painter.drawRect(colorBox)
         painter.drawText(colorBox.x(), colorBox.y() + color_square_size + 15, colorLabel)
 
+    def backgroundPixmap(self):
+        """Return the dimmed screenshot, composed once and rebuilt only when the overlay is resized."""
+        dpr = self.devicePixelRatioF()
+        key = (self.size(), dpr)
+        if self.backgroundCache is None or key != self.backgroundCacheKey:
+            background = QPixmap(round(self.width() * dpr), round(self.height() * dpr))
+            background.setDevicePixelRatio(dpr)
+            background.fill(Qt.transparent)
+            painter = QPainter(background)
+            if self.screenshot_pixmap:
+                # The screenshot is opaque: copy it instead of blending
+                painter.setCompositionMode(QPainter.CompositionMode_Source)
+                painter.drawPixmap(0, 0, self.screenshot_pixmap)
+                painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
+            painter.fillRect(self.rect(), self.DIM_COLOR)
+            painter.end()
+            self.backgroundCache = background
+            self.backgroundCacheKey = key
+        return self.backgroundCache
+
     def paintEvent(self, event):
         painter = QPainter(self)
-        if self.screenshot_pixmap:
-            painter.drawPixmap(self.rect(), self.screenshot_pixmap)
-
-        painter.fillRect(self.rect(), QColor(0, 0, 0, 100))
+        # Screenshot and dim layer in a single straight copy
+        painter.setCompositionMode(QPainter.CompositionMode_Source)
+        painter.drawPixmap(0, 0, self.backgroundPixmap())
+        painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
 
         if self.dragging and self.startPos and self.endPos:
             startLocal = self.physicalToLocalLogical(self.startPos)
             endLocal = self.physicalToLocalLogical(self.endPos)
             selectionRect = QRect(startLocal, endLocal)
-            painter.setPen(QPen(Qt.white, 1))
-            painter.setBrush(QColor(255, 255, 255, 50))
+            painter.setPen(self.SELECTION_PEN)
+            painter.setBrush(self.SELECTION_BRUSH)
             painter.drawRect(selectionRect)
 
         if self.zoomActivated and self.zoomFactor > 1:
@@ -309,11 +419,11 @@ class TransparentOverlay(QDialog):
         # Determine which color to display in the preview
         if self.dragging and self.averageColor:
             displayColor = self.averageColor
-            colorLabel = f"Avg: #{displayColor.red():02x}{displayColor.green():02x}{displayColor.blue():02x}"
+            colorLabel = f"Avg: {displayColor.name()}"
         else:
             samplePos = self.virtualCursorPos if (self.zoomActivated and self.virtualCursorPos is not None) else self.cursorPos
             displayColor = self.getPixelColor(samplePos)
-            colorLabel = f"#{displayColor.red():02x}{displayColor.green():02x}{displayColor.blue():02x}"
+            colorLabel = displayColor.name()
         cursorLocal = self.physicalToLocalLogical(self.cursorPos)
         self.drawColorBoxes(painter, cursorLocal, displayColor, colorLabel)
 
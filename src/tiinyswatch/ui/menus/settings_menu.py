@@ -1,4 +1,5 @@
 from PySide6.QtWidgets import QMenu, QInputDialog
+from PySide6.QtCore import QTimer
 from PySide6.QtGui import QAction, QActionGroup
 from tiinyswatch.utils.settings import Settings
 from tiinyswatch.utils.clipboard_manager import ClipboardManager
@@ -7,6 +8,9 @@ from tiinyswatch.ui.dialogs import KeybindDialog
 
 CHANGE_KEYBIND_TITLE = "Change Keybind"
 CHANGE_KEYBIND_PROMPT = "Press the key combination you want to use:"
+# Color changes are folded into at most one label refresh per interval (~30 Hz)
+COLOR_ACTIONS_UPDATE_INTERVAL_MS = 33
+FORMAT_ACTION_ORDER = ("HEX", "RGB", "HSV", "HSL", "CMYK", "LAB")
 
 
 class SettingsMenu(QMenu):
@@ -22,10 +26,16 @@ class SettingsMenu(QMenu):
         super().__init__(parent)
         self.parent = parent
         self.setTitle("TiinySwatch v1.0")
+        # (value_only, color state) the format action labels were last rendered for
+        self.colorActionsKey = None
 
         # Listen for color changes so we can update the format action text
-        Settings.addListener("SET", "currentColors", self.updateColorActions)
-        Settings.addListener("SET", "VALUE_ONLY", self.updateColorActions)
+        self.colorActionsTimer = QTimer(self)
+        self.colorActionsTimer.setSingleShot(True)
+        self.colorActionsTimer.setInterval(COLOR_ACTIONS_UPDATE_INTERVAL_MS)
+        self.colorActionsTimer.timeout.connect(lambda: self.updateColorActions(None))
+        Settings.addListener("SET", "currentColors", self.scheduleColorActionsUpdate)
+        Settings.addListener("SET", "VALUE_ONLY", self.scheduleColorActionsUpdate)
 
         # Build the menu in sections
         self.initKeybindsSubmenu()
@@ -83,42 +93,16 @@ class SettingsMenu(QMenu):
         """
         self.formatActionGroup = QActionGroup(self)
         self.formatActionGroup.setExclusive(True)
+        self.formatActionGroup.triggered.connect(self.onFormatActionTriggered)
 
-        # HEX Action
-        self.hexAction = QAction("HEX", self, checkable=True)
-        self.hexAction.triggered.connect(lambda checked: self.onFormatSelected("HEX") if checked else None)
-        self.formatActionGroup.addAction(self.hexAction)
-        self.addAction(self.hexAction)
-
-        # RGB Action
-        self.rgbAction = QAction("RGB", self, checkable=True)
-        self.rgbAction.triggered.connect(lambda checked: self.onFormatSelected("RGB") if checked else None)
-        self.formatActionGroup.addAction(self.rgbAction)
-        self.addAction(self.rgbAction)
-
-        # HSV Action
-        self.hsvAction = QAction("HSV", self, checkable=True)
-        self.hsvAction.triggered.connect(lambda checked: self.onFormatSelected("HSV") if checked else None)
-        self.formatActionGroup.addAction(self.hsvAction)
-        self.addAction(self.hsvAction)
-
-        # HSL Action
-        self.hslAction = QAction("HSL", self, checkable=True)
-        self.hslAction.triggered.connect(lambda checked: self.onFormatSelected("HSL") if checked else None)
-        self.formatActionGroup.addAction(self.hslAction)
-        self.addAction(self.hslAction)
-
-        # CMYK Action
-        self.cmykAction = QAction("CMYK", self, checkable=True)
-        self.cmykAction.triggered.connect(lambda checked: self.onFormatSelected("CMYK") if checked else None)
-        self.formatActionGroup.addAction(self.cmykAction)
-        self.addAction(self.cmykAction)
-
-        # LAB Action
-        self.labAction = QAction("LAB", self, checkable=True)
-        self.labAction.triggered.connect(lambda checked: self.onFormatSelected("LAB") if checked else None)
-        self.formatActionGroup.addAction(self.labAction)
-        self.addAction(self.labAction)
+        # Format -> action, in menu order
+        self.formatActions = {}
+        for formatStr in FORMAT_ACTION_ORDER:
+            action = QAction(formatStr, self, checkable=True)
+            action.setData(formatStr)
+            self.formatActionGroup.addAction(action)
+            self.addAction(action)
+            self.formatActions[formatStr] = action
 
     def initExitAction(self):
         """
@@ -145,6 +129,11 @@ class SettingsMenu(QMenu):
         if key:
             Settings.set(settingKey, key)
 
+    def onFormatActionTriggered(self, action):
+        """Single slot for every format action; the format is stored in the action's data."""
+        if action.isChecked():
+            self.onFormatSelected(action.data())
+
     def onFormatSelected(self, formatStr):
         """
         When the user checks one of the format actions (RGB, HEX, or HSV),
@@ -160,40 +149,29 @@ class SettingsMenu(QMenu):
     # ------------------------------------------------------------------
     def checkCurrentFormat(self):
         """Check whichever format is stored in Settings and mark that action as checked."""
-        currentFormat = Settings.get("FORMAT") or "RGB"
-        if currentFormat == "RGB":
-            self.rgbAction.setChecked(True)
-        elif currentFormat == "HEX":
-            self.hexAction.setChecked(True)
-        elif currentFormat == "HSV":
-            self.hsvAction.setChecked(True)
-        elif currentFormat == "HSL":
-            self.hslAction.setChecked(True)
-        elif currentFormat == "CMYK":
-            self.cmykAction.setChecked(True)
-        elif currentFormat == "LAB":
-            self.labAction.setChecked(True)
+        action = self.formatActions.get(Settings.get("FORMAT") or "RGB")
+        if action:
+            action.setChecked(True)
+
+    def scheduleColorActionsUpdate(self, _):
+        """Coalesce bursts of color/format changes into a single updateColorActions call."""
+        if not self.colorActionsTimer.isActive():
+            self.colorActionsTimer.start()
 
     def updateColorActions(self, _):
         """
         Update the text for RGB, HEX, and HSV actions based on the current color in Settings.
-        This method is called whenever 'currentColor' changes via Settings.addListener.
+        Settings changes reach it through scheduleColorActionsUpdate, at most once per interval.
         """
         colors = Settings.get("currentColors")
-        if len(colors) < 1:
-            colors = [QColorEnhanced()]  # fallback
+        color = colors[0] if len(colors) > 0 else QColorEnhanced()  # fallback
+
+        # Skip the relabel when neither the color nor the value-only mode changed
+        key = (Settings.get("VALUE_ONLY"), color.state_key())
+        if key == self.colorActionsKey:
+            return
+        self.colorActionsKey = key
 
         # Generate text from ClipboardManager's format templates
-        rgbText = ClipboardManager.getFormattedColor(colors[0], "RGB") + " (rgb)"
-        hexText = ClipboardManager.getFormattedColor(colors[0], "HEX") + " (hex)"
-        hsvText = ClipboardManager.getFormattedColor(colors[0], "HSV") + " (hsv)"
-        hslText = ClipboardManager.getFormattedColor(colors[0], "HSL") + " (hsl)"
-        cmykText = ClipboardManager.getFormattedColor(colors[0], "CMYK") + " (cmyk)"
-        labText = ClipboardManager.getFormattedColor(colors[0], "LAB") + " (lab)"
-
-        self.rgbAction.setText(rgbText)
-        self.hexAction.setText(hexText)
-        self.hsvAction.setText(hsvText)
-        self.hslAction.setText(hslText)
-        self.cmykAction.setText(cmykText)
-        self.labAction.setText(labText)
\ No newline at end of file
+        for formatStr, action in self.formatActions.items():
+            action.setText(f"{ClipboardManager.getFormattedColor(color, formatStr)} ({formatStr.lower()})")
\ No newline at end of file
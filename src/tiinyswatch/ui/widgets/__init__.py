@@ -1,6 +1,25 @@
 """Widget components for the TiinySwatch application."""
 
-from .color_picker import ColorPicker
-from .history_palette import HistoryPalette
+import importlib
 
-__all__ = ['ColorPicker', 'HistoryPalette'] 
\ No newline at end of file
+# Resolved on first access (PEP 562): the controls import color_widgets through this
+# package, and loading the picker here would import the controls back mid-initialization.
+_LAZY_EXPORTS = {
+    'ColorPicker': '.color_picker',
+    'HistoryPalette': '.history_palette',
+}
+
+__all__ = ['ColorPicker', 'HistoryPalette']
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
\ No newline at end of file
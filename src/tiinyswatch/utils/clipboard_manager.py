@@ -1,3 +1,4 @@
+from collections import OrderedDict
 from PySide6.QtWidgets import QApplication
 from .settings import Settings
 # Remove the circular import
@@ -116,10 +117,14 @@ COLOR_FORMAT_CONFIG = {
 
 class ClipboardManager:
     COLOR_FORMAT_CONFIG = COLOR_FORMAT_CONFIG
+    FORMAT_CACHE_SIZE = 256
+    # (format, value_only, color state) -> formatted string, in LRU order
+    _formatCache = OrderedDict()
 
     @classmethod
-    def getTemplate(cls, format_type: str):
-        value_only = Settings.get("VALUE_ONLY")
+    def getTemplate(cls, format_type: str, value_only=None):
+        if value_only is None:
+            value_only = Settings.get("VALUE_ONLY")
         key = "value_only" if value_only else "full"
         try:
             return cls.COLOR_FORMAT_CONFIG[format_type][key]
@@ -132,17 +137,30 @@ class ClipboardManager:
             color = QColorEnhanced.from_qcolor(color)
         if format_type == None:
             format_type = Settings.get("FORMAT")
-        config = cls.getTemplate(format_type)
-        return format_color_generic(color, config)
+        value_only = Settings.get("VALUE_ONLY")
+
+        cache_key = (format_type, value_only, color.state_key())
+        formatted = cls._formatCache.get(cache_key)
+        if formatted is not None:
+            cls._formatCache.move_to_end(cache_key)
+            return formatted
+
+        config = cls.getTemplate(format_type, value_only)
+        formatted = format_color_generic(color, config)
+        cls._formatCache[cache_key] = formatted
+        if len(cls._formatCache) > cls.FORMAT_CACHE_SIZE:
+            cls._formatCache.popitem(last=False)
+        return formatted
     
     @classmethod
     def copyColorsToClipboard(cls, indices):
         clipboard = QApplication.clipboard()
         colors = Settings.get("colors")
+        format_type = Settings.get("FORMAT")
         clipboard_strings = []
         for i, color in enumerate(colors):
             if i in indices:
-                clipboard_strings.append(cls.getFormattedColor(color))
+                clipboard_strings.append(cls.getFormattedColor(color, format_type))
         clipboard.setText("\n".join(clipboard_strings))
         NotificationManager.notify("Colors copied to clipboard!", NotificationType.OK)
 
@@ -1,6 +1,5 @@
 import ctypes
 import ctypes.wintypes
-from PySide6.QtCore import Signal
 from PySide6.QtWidgets import QWidget
 from .settings import Settings
 
@@ -25,7 +24,6 @@ VIRTUAL_KEY_CODES = {
 }
 
 class KeybindManager(QWidget):
-    hotkey_triggered = Signal(int)
     KEYBIND_KEYS = ["PICK_KEYBIND", "TOGGLE_KEYBIND", "HISTORY_KEYBIND"]
     
     def __init__(self):
@@ -33,12 +31,10 @@ class KeybindManager(QWidget):
         self.hotkey_ids = {}  # Maps hotkey IDs to (vk, modifiers) tuples
         self.next_id = 1
         self.bindings = {}    # Maps setting keys to hotkey IDs
+        self.binding_keys = {}  # Reverse of bindings: hotkey IDs to setting keys
         self.callbacks = {}   # Maps setting keys to callback functions
         self.signals_enabled = True  # Flag to enable/disable hotkey signal emission
         self.stored_hotkeys = {}  # Temporary storage for disabled hotkeys
-        
-        # Connect the signal to our own handler
-        self.hotkey_triggered.connect(self.handle_hotkey)
     
     @classmethod
     def initialize(cls, parent):
@@ -78,7 +74,8 @@ class KeybindManager(QWidget):
         if msg.message == WM_HOTKEY:
             hotkey_id = msg.wParam
             if hotkey_id in self.hotkey_ids and self.signals_enabled:
-                self.hotkey_triggered.emit(hotkey_id)
+                # WM_HOTKEY arrives on the GUI thread, so dispatch directly
+                self.handle_hotkey(hotkey_id)
                 return True, 0
         return False, 0
     
@@ -122,17 +119,18 @@ class KeybindManager(QWidget):
         # Unregister the old binding if it exists
         self.unregister_binding(key)
         
-        # Register the new binding
-        self.register_binding(key)
+        # Register the new binding (the listener already has the new value)
+        self.register_binding(key, new_hotkey)
     
-    def register_binding(self, key):
-        """Register a hotkey binding for a setting key."""
+    def register_binding(self, key, hotkey_str=None):
+        """Register a hotkey binding for a setting key (defaults to the hotkey stored in Settings)."""
         # Validate the key
         if not self._validate_key(key):
             return
         
         # Get the hotkey string from settings
-        hotkey_str = Settings.get(key)
+        if hotkey_str is None:
+            hotkey_str = Settings.get(key)
         if not hotkey_str:
             return
         
@@ -145,12 +143,14 @@ class KeybindManager(QWidget):
         hotkey_id = self.register_hotkey(vk, modifiers)
         if hotkey_id:
             self.bindings[key] = hotkey_id
+            self.binding_keys[hotkey_id] = key
     
     def unregister_binding(self, key):
         """Unregister a hotkey binding for a setting key."""
-        if key in self.bindings:
-            self.unregister_hotkey(self.bindings[key])
-            del self.bindings[key]
+        hotkey_id = self.bindings.pop(key, None)
+        if hotkey_id is not None:
+            self.unregister_hotkey(hotkey_id)
+            self.binding_keys.pop(hotkey_id, None)
     
     def bindKey(self, key, callback):
         """Bind a callback to a keybind."""
@@ -176,7 +176,7 @@ class KeybindManager(QWidget):
     def handle_hotkey(self, hk_id):
         """Handle a hotkey press by calling the associated callbacks."""
         # Find the setting key for this hotkey ID
-        key = next((k for k, v in self.bindings.items() if v == hk_id), None)
+        key = self.binding_keys.get(hk_id)
         if key and key in self.callbacks and self.signals_enabled:
             # Call all callbacks for this key
             for callback in self.callbacks[key]:
@@ -208,6 +208,7 @@ class KeybindManager(QWidget):
         # Clear current hotkey registrations but keep the mapping info
         # so we can restore it later
         self.bindings = {}
+        self.binding_keys = {}
         
     def enableSignals(self):
         """
@@ -223,6 +224,7 @@ class KeybindManager(QWidget):
             hotkey_id = self.register_hotkey(vk, modifiers)
             if hotkey_id:
                 self.bindings[key] = hotkey_id
+                self.binding_keys[hotkey_id] = key
                 
         # Clear the storage
         self.stored_hotkeys = {} 
\ No newline at end of file
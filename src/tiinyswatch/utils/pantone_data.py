@@ -2,42 +2,60 @@ import json
 import os
 import sys
 import pickle
+import threading
 import numpy as np
 
 class PantoneData:
     """
     Manages Pantone color data for the application.
     
-    Provides access to Pantone color names and XYZ values.
+    Provides access to Pantone color names and XYZ values. Once loaded, names is
+    a list and xyz_values an (n, 3) float array.
     """
     # Class variables to hold data
     names = None
     xyz_values = None
     _is_initialized = False
     _np_mmap = None  # Reference to memory-mapped file
+    _load_lock = threading.Lock()  # Data may be preloaded from a worker thread
     
     @classmethod
-    def initialize(cls):
+    def preload(cls):
         """
-        Initialize class metadata but don't load data yet.
-        This allows fast startup while still keeping the same API.
+        Load the data ahead of first use. Safe to run from a worker thread
+        so the first Pantone lookup on the UI thread doesn't block on disk I/O.
         """
-        # We don't load data immediately
-        cls._is_initialized = False
-    
+        cls._ensure_loaded()
+
+    @classmethod
+    def is_loading(cls):
+        """True while another thread is loading the data, i.e. a lookup now would block on it."""
+        return not cls._is_initialized and cls._load_lock.locked()
+
     @classmethod
     def _ensure_loaded(cls):
         """Ensure data is loaded before accessing it."""
         if not cls._is_initialized:
-            cls._load_data()
-            cls._is_initialized = True
+            with cls._load_lock:
+                if not cls._is_initialized:
+                    cls._load_data()
+                    # Every source ends up as one (n, 3) array, so lookups never walk per-entry lists
+                    cls.xyz_values = np.asarray(cls.xyz_values, dtype=float).reshape(-1, 3)
+                    cls._is_initialized = True
         
     @staticmethod
     def _get_data_dir():
         """Resolve the data directory, handling frozen (PyInstaller/cx_Freeze) builds."""
         if getattr(sys, '_MEIPASS', None):
             return os.path.join(sys._MEIPASS, 'tiinyswatch', 'utils')
-        return os.path.dirname(os.path.abspath(__file__))
+        module_dir = os.path.dirname(os.path.abspath(__file__))
+        if not os.path.isdir(module_dir):
+            # Imported from a zip archive: the data files stay on disk in the source tree
+            for entry in sys.path:
+                candidate = os.path.join(entry, 'tiinyswatch', 'utils')
+                if os.path.isdir(candidate):
+                    return candidate
+        return module_dir
 
     @classmethod
     def _load_data(cls):
@@ -57,12 +75,13 @@ class PantoneData:
                 # Memory map the numpy arrays (minimal load time, lazy evaluation)
                 cls._np_mmap = np.load(np_path, mmap_mode='r')
                 
-                # Extract data from numpy arrays
+                # Extract data from numpy arrays; XYZ stays an array rather than
+                # becoming one Python list per color
                 cls.names = cls._np_mmap['names'].tolist()
-                cls.xyz_values = cls._np_mmap['xyz_values'].tolist()
+                cls.xyz_values = cls._np_mmap['xyz_values']
                 
                 # Verify data integrity
-                if cls.names and cls.xyz_values and len(cls.names) == len(cls.xyz_values):
+                if cls.names and len(cls.xyz_values) and len(cls.names) == len(cls.xyz_values):
                     return
                 else:
                     print("Malformed numpy data: names/values length mismatch or empty")
@@ -148,7 +167,7 @@ class PantoneData:
         cls._ensure_loaded()
         try:
             index = cls.names.index(name)
-            return cls.xyz_values[index]
+            return cls.xyz_values[index].tolist()
         except ValueError:
             return None
 
@@ -160,22 +179,26 @@ class PantoneData:
 
     @classmethod
     def get_xyz_values(cls):
-        """Get a list of all Pantone XYZ values."""
+        """Get all Pantone XYZ values as an (n, 3) array."""
         cls._ensure_loaded()
         return cls.xyz_values
 
     @classmethod
-    def generate_xyz_json(cls):
+    def generate_xyz_json(cls, force=False):
         """
         Generate a JSON file with Pantone XYZ values.
         This is a utility method used during development.
+        Skipped when the generated file is already newer than the source, unless force is set.
         """
         import json
-        from colormath.color_objects import sRGBColor, XYZColor
-        from colormath.color_conversions import convert_color
+        from tiinyswatch.color.conversions import srgb_to_xyz
         
         # Load the Pantone colors from the JSON file
         json_path = os.path.join(cls._get_data_dir(), 'pantone-colors.json')
+        xyz_json_path = os.path.join(cls._get_data_dir(), 'pantone-xyz-colors.json')
+        if not force and os.path.exists(xyz_json_path) and os.path.getmtime(xyz_json_path) >= os.path.getmtime(json_path):
+            return "Pantone data files are up to date"
+
         with open(json_path, 'r') as f:
             data = json.load(f)
             
@@ -189,8 +212,8 @@ class PantoneData:
                 print(f"Error: Mismatch between names ({len(names)}) and values ({len(hex_values)})")
                 return
                 
-            # Extract names and convert hex values to XYZ
-            xyz_values = []
+            # Parse hex values to RGB (0-1 range), then convert them to XYZ in one batch
+            rgb_values = []
             
             for i, (name, hex_color) in enumerate(zip(names, hex_values)):
                 try:
@@ -204,15 +227,12 @@ class PantoneData:
                         print(f"Warning: Invalid hex color for {name}: {hex_color}")
                         continue
                     
-                    # Convert RGB to XYZ
-                    rgb_color = sRGBColor(r, g, b)
-                    xyz_color = convert_color(rgb_color, XYZColor)
-                    
-                    # Store the XYZ values
-                    xyz_values.append([xyz_color.xyz_x, xyz_color.xyz_y, xyz_color.xyz_z])
+                    rgb_values.append([r, g, b])
                 except Exception as e:
                     print(f"Error converting color {name} (#{hex_color}): {e}")
-                    xyz_values.append([0, 0, 0])  # Add placeholder
+                    rgb_values.append([0, 0, 0])  # Add placeholder (black stays [0, 0, 0] in XYZ)
+            
+            xyz_values = srgb_to_xyz(np.array(rgb_values, dtype=float).reshape(-1, 3)).tolist()
             
             # Filter out any names that didn't convert properly
             if len(names) != len(xyz_values):
@@ -236,7 +256,6 @@ class PantoneData:
         utils_dir = cls._get_data_dir()
         
         # Save as JSON (most compatible)
-        xyz_json_path = os.path.join(utils_dir, 'pantone-xyz-colors.json')
         with open(xyz_json_path, 'w') as f:
             json.dump({'names': names, 'xyz_values': xyz_values}, f)
             
@@ -249,7 +268,7 @@ class PantoneData:
         # Save as numpy array (fastest loading via mmap)
         np_path = os.path.join(utils_dir, 'pantone-xyz-colors')
         cls.names = names
-        cls.xyz_values = xyz_values
+        cls.xyz_values = np.asarray(xyz_values, dtype=float)
         cls._save_as_numpy(np_path)
         
         return f"Generated Pantone data files with {len(names)} colors" 
\ No newline at end of file